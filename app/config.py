@@ -19,9 +19,17 @@ class Settings(BaseSettings):
     # Require explicit database URL in env (no baked-in default)
     DATABASE_URL: str = Field(..., description="PostgreSQL connection string")
     AUTH_DATABASE_URL: str = Field(..., description="Auth PostgreSQL connection string")
+    AUTH_DATABASE_REPLICA_URL: Optional[str] = Field(None, description="Read replica of the auth database for read-only admin queries")
     DATABASE_POOL_MIN_SIZE: int = 2
     DATABASE_POOL_MAX_SIZE: int = 10
     DATABASE_COMMAND_TIMEOUT: int = 60
+    DATABASE_STATEMENT_CACHE_SIZE: int = 1024
+    DATABASE_MAX_CACHED_STATEMENT_LIFETIME: int = 0
+    DATABASE_POOL_MAX_QUERIES: int = 50000
+    DATABASE_POOL_MAX_INACTIVE_CONNECTION_LIFETIME: float = 300.0
+    DATABASE_TCP_KEEPALIVES_IDLE: int = 30
+    DATABASE_TCP_KEEPALIVES_INTERVAL: int = 10
+    DATABASE_TCP_KEEPALIVES_COUNT: int = 3
     
     # CORS Configuration
     # Require explicit frontend origins in env (no baked-in default)
@@ -2,14 +2,77 @@
 Database connection and utilities
 """
 import asyncpg
-from typing import Optional
+import orjson
+from typing import Iterable, List, Optional, Tuple
 from app.config import settings
 
 
+async def _warm_statement_cache(connection: asyncpg.Connection, statements: List[Tuple[str, int]]):
+    """Run each statement with NULL arguments so asyncpg caches its prepared plan.
+
+    Only register a handful of hot, read-only statements: each one is a round
+    trip on every connection open, and replica connections run them too.
+    Statements must be no-ops when every parameter is NULL (e.g. ``WHERE id = $n``).
+    ``Connection.prepare()`` would not help here: its statements bypass the cache
+    that ``execute()``/``fetch()`` consult.
+    """
+    for query, arg_count in statements:
+        await connection.execute(query, *([None] * arg_count))
+
+
+def _encode_json(value) -> str:
+    # Callers mostly pass JSON they serialized themselves; send that through
+    # as-is and only serialize native Python values
+    if isinstance(value, str):
+        return value
+    return orjson.dumps(value).decode('utf-8')
+
+
+async def _set_type_codecs(connection: asyncpg.Connection):
+    """Decode UUIDs straight to ``str`` and JSON/JSONB to Python objects.
+
+    Handlers turn every id into a string for their responses anyway; doing it
+    in the protocol layer skips building a ``uuid.UUID`` per value first.
+    JSON columns arrive already parsed (with orjson), so handlers never
+    ``json.loads`` row values themselves.
+    """
+    await connection.set_type_codec(
+        'uuid', encoder=str, decoder=str, schema='pg_catalog', format='text'
+    )
+    for json_type in ('json', 'jsonb'):
+        await connection.set_type_codec(
+            json_type, encoder=_encode_json, decoder=orjson.loads, schema='pg_catalog', format='text'
+        )
+
+
+def _server_settings() -> dict:
+    """Per-connection server settings shared by both pools"""
+    # TCP keepalives stop idle pooled connections from being silently dropped
+    # by NATs/load balancers, which otherwise surface later as
+    # ConnectionDoesNotExistError on the next query
+    return {
+        'tcp_keepalives_idle': str(settings.DATABASE_TCP_KEEPALIVES_IDLE),
+        'tcp_keepalives_interval': str(settings.DATABASE_TCP_KEEPALIVES_INTERVAL),
+        'tcp_keepalives_count': str(settings.DATABASE_TCP_KEEPALIVES_COUNT),
+    }
+
+
 class Database:
     """Database connection pool manager"""
     
     _pool: Optional[asyncpg.Pool] = None
+    # (query, parameter count) pairs primed on every new pool connection
+    _warm_statements: List[Tuple[str, int]] = []
+    
+    @classmethod
+    def warm_statements(cls, statements: Iterable[Tuple[str, int]]):
+        """Register hot read-only statements to prepare when a pool connection is opened"""
+        cls._warm_statements.extend(statements)
+    
+    @classmethod
+    async def _init_connection(cls, connection: asyncpg.Connection):
+        await _set_type_codecs(connection)
+        await _warm_statement_cache(connection, cls._warm_statements)
     
     @classmethod
     async def get_pool(cls) -> asyncpg.Pool:
@@ -19,7 +82,13 @@ class Database:
                 settings.DATABASE_URL,
                 min_size=settings.DATABASE_POOL_MIN_SIZE,
                 max_size=settings.DATABASE_POOL_MAX_SIZE,
-                command_timeout=settings.DATABASE_COMMAND_TIMEOUT
+                max_queries=settings.DATABASE_POOL_MAX_QUERIES,
+                max_inactive_connection_lifetime=settings.DATABASE_POOL_MAX_INACTIVE_CONNECTION_LIFETIME,
+                command_timeout=settings.DATABASE_COMMAND_TIMEOUT,
+                statement_cache_size=settings.DATABASE_STATEMENT_CACHE_SIZE,
+                max_cached_statement_lifetime=settings.DATABASE_MAX_CACHED_STATEMENT_LIFETIME,
+                server_settings=_server_settings(),
+                init=cls._init_connection
             )
         return cls._pool
     
@@ -63,22 +132,67 @@ class AuthDatabase:
     """Auth database connection pool manager (shared auth DB)"""
 
     _pool: Optional[asyncpg.Pool] = None
+    _read_pool: Optional[asyncpg.Pool] = None
+    # (query, parameter count) pairs primed on every new pool connection
+    _warm_statements: List[Tuple[str, int]] = []
+
+    @classmethod
+    def warm_statements(cls, statements: Iterable[Tuple[str, int]]):
+        """Register hot read-only statements to prepare when a pool connection is opened"""
+        cls._warm_statements.extend(statements)
+
+    @classmethod
+    async def _init_connection(cls, connection: asyncpg.Connection):
+        await _set_type_codecs(connection)
+        await _warm_statement_cache(connection, cls._warm_statements)
+
+    @classmethod
+    async def _init_read_connection(cls, connection: asyncpg.Connection):
+        # Replica connections are read-only: anything but a SELECT would fail
+        # with ReadOnlySQLTransactionError and take the connection down with it
+        await _set_type_codecs(connection)
+        await _warm_statement_cache(connection, [
+            (query, arg_count) for query, arg_count in cls._warm_statements
+            if query.lstrip().upper().startswith("SELECT")
+        ])
+
+    @classmethod
+    async def _create_pool(cls, dsn: str, init) -> asyncpg.Pool:
+        return await asyncpg.create_pool(
+            dsn,
+            min_size=settings.DATABASE_POOL_MIN_SIZE,
+            max_size=settings.DATABASE_POOL_MAX_SIZE,
+            max_queries=settings.DATABASE_POOL_MAX_QUERIES,
+            max_inactive_connection_lifetime=settings.DATABASE_POOL_MAX_INACTIVE_CONNECTION_LIFETIME,
+            command_timeout=settings.DATABASE_COMMAND_TIMEOUT,
+            statement_cache_size=settings.DATABASE_STATEMENT_CACHE_SIZE,
+            max_cached_statement_lifetime=settings.DATABASE_MAX_CACHED_STATEMENT_LIFETIME,
+            server_settings=_server_settings(),
+            init=init
+        )
 
     @classmethod
     async def get_pool(cls) -> asyncpg.Pool:
         """Get or create auth database connection pool"""
         if cls._pool is None:
-            cls._pool = await asyncpg.create_pool(
-                settings.AUTH_DATABASE_URL,
-                min_size=settings.DATABASE_POOL_MIN_SIZE,
-                max_size=settings.DATABASE_POOL_MAX_SIZE,
-                command_timeout=settings.DATABASE_COMMAND_TIMEOUT
-            )
+            cls._pool = await cls._create_pool(settings.AUTH_DATABASE_URL, cls._init_connection)
         return cls._pool
 
+    @classmethod
+    async def get_read_pool(cls) -> asyncpg.Pool:
+        """Get or create the read replica pool, falling back to the primary when no replica is configured"""
+        if not settings.AUTH_DATABASE_REPLICA_URL:
+            return await cls.get_pool()
+        if cls._read_pool is None:
+            cls._read_pool = await cls._create_pool(settings.AUTH_DATABASE_REPLICA_URL, cls._init_read_connection)
+        return cls._read_pool
+
     @classmethod
     async def close_pool(cls):
-        """Close auth database connection pool"""
+        """Close auth database connection pools"""
+        if cls._read_pool:
+            await cls._read_pool.close()
+            cls._read_pool = None
         if cls._pool:
             await cls._pool.close()
             cls._pool = None
@@ -111,6 +225,30 @@ class AuthDatabase:
         async with pool.acquire() as connection:
             return await connection.fetchval(query, *args)
 
+    # Read-only variants, served by the replica when one is configured. Only
+    # use them where replication lag is acceptable (listings, not auth checks).
+
+    @classmethod
+    async def fetch_ro(cls, query: str, *args):
+        """Fetch multiple rows from the read replica"""
+        pool = await cls.get_read_pool()
+        async with pool.acquire() as connection:
+            return await connection.fetch(query, *args)
+
+    @classmethod
+    async def fetchrow_ro(cls, query: str, *args):
+        """Fetch a single row from the read replica"""
+        pool = await cls.get_read_pool()
+        async with pool.acquire() as connection:
+            return await connection.fetchrow(query, *args)
+
+    @classmethod
+    async def fetchval_ro(cls, query: str, *args):
+        """Fetch a single value from the read replica"""
+        pool = await cls.get_read_pool()
+        async with pool.acquire() as connection:
+            return await connection.fetchval(query, *args)
+
 
 async def check_database_connection() -> dict:
     """Check if database connection is working"""
@@ -1,8 +1,10 @@
 """
 Dependencies for FastAPI routes
 """
+import time
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from app.cache import TTLCache
 from app.jwt_utils import decode_access_token, get_user_id_from_token, is_token_expired
 from app.repositories.user_repo import UserRepository
 from app.repositories.creator_repo import CreatorRepository
@@ -10,31 +12,46 @@ from app.repositories.hotel_repo import HotelRepository
 
 security = HTTPBearer()
 
+# Verified token payloads, so bursts of requests with the same token skip
+# re-verifying it; an entry never outlives the token's own expiry
+_token_payload_cache = TTLCache(maxsize=10_000, ttl=60)
 
-async def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
-    """
-    Get current user ID from JWT token in Authorization header.
 
-    Expects: Authorization: Bearer <token>
+def _get_token_user_id(token: str) -> str:
     """
-    token = credentials.credentials
-
-    # Check if token is expired (for better error message)
-    if is_token_expired(token):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token has expired. Please login again.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    Verify a bearer token and return its subject (user ID).
 
-    # Decode and verify token
-    payload = decode_access_token(token)
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    Raises 401 for expired, invalid or subject-less tokens.
+    """
+    payload = _token_payload_cache.get(token)
+
+    # The cache entry's TTL is capped at the token's remaining lifetime, but
+    # it runs on the monotonic clock; check ``exp`` against wall time too so
+    # a cached payload can never outlive its token
+    if payload is not None and payload["exp"] <= time.time():
+        _token_payload_cache.delete(token)
+        payload = None
+
+    if payload is None:
+        # Check if token is expired (for better error message)
+        if is_token_expired(token):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has expired. Please login again.",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        # Decode and verify token
+        payload = decode_access_token(token)
+        if not payload:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        if payload.get("exp"):
+            _token_payload_cache.set(token, payload, ttl=payload["exp"] - time.time())
 
     # Get user ID from token
     user_id = payload.get("sub")
@@ -45,6 +62,21 @@ async def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depend
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    return user_id
+
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    """
+    Get the current user's id, type and status from the JWT token in the Authorization header.
+
+    Rejects users that do not exist or are not verified. FastAPI caches
+    dependency results per request, so every dependency of a request that
+    needs the user shares this one lookup.
+
+    Expects: Authorization: Bearer <token>
+    """
+    user_id = _get_token_user_id(credentials.credentials)
+
     # Verify user exists and check status
     user = await UserRepository.get_by_id(user_id, columns="id, type, status")
 
@@ -68,7 +100,16 @@ async def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depend
             detail=detail,
         )
 
-    return user_id
+    return user
+
+
+async def get_current_user_id(user: dict = Depends(get_current_user)) -> str:
+    """
+    Get current user ID from JWT token in Authorization header.
+
+    Expects: Authorization: Bearer <token>
+    """
+    return user['id']
 
 
 async def get_current_user_id_allow_pending(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
@@ -76,30 +117,7 @@ async def get_current_user_id_allow_pending(credentials: HTTPAuthorizationCreden
     Get current user ID from JWT token, allowing pending/unverified users.
     Used for profile completion endpoints that need to work before verification.
     """
-    token = credentials.credentials
-
-    if is_token_expired(token):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token has expired. Please login again.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    payload = decode_access_token(token)
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    user_id = payload.get("sub")
-    if not user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    user_id = _get_token_user_id(credentials.credentials)
 
     # Verify user exists (but don't check status)
     user = await UserRepository.get_by_id(user_id, columns="id")
@@ -5,6 +5,7 @@ import asyncio
 import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from app.database import Database, AuthDatabase, check_database_connection
 from app.config import settings
@@ -71,7 +72,9 @@ app = FastAPI(
     description="Vayada Creator Marketplace Backend API",
     version=settings.API_VERSION,
     lifespan=lifespan,
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    # Render JSON bodies with orjson rather than the stdlib encoder
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS from environment variables
@@ -111,9 +111,6 @@ from app.models.admin import (
     UpdateUserRequest,
     AdminPlatformResponse,
     CreatorProfileDetail,
-    AdminCollaborationOfferingResponse,
-    AdminCreatorRequirementsResponse,
-    AdminListingResponse,
     HotelProfileDetail,
     UserDetailResponse,
 )
@@ -196,9 +193,6 @@ __all__ = [
     "UpdateUserRequest",
     "AdminPlatformResponse",
     "CreatorProfileDetail",
-    "AdminCollaborationOfferingResponse",
-    "AdminCreatorRequirementsResponse",
-    "AdminListingResponse",
     "HotelProfileDetail",
     "UserDetailResponse",
 ]
@@ -4,7 +4,6 @@ Admin-specific Pydantic models
 from pydantic import BaseModel, Field, EmailStr, model_validator, ConfigDict
 from typing import List, Optional, Union, Literal
 from datetime import datetime
-from decimal import Decimal
 
 from app.models.common import (
     CollaborationOfferingResponse,
@@ -36,6 +35,7 @@ class UserListResponse(BaseModel):
     """User list response"""
     users: List[UserResponse]
     total: int
+    next_cursor: Optional[str] = None
 
 
 # ============================================
@@ -165,51 +165,6 @@ class CreatorProfileDetail(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
-class AdminCollaborationOfferingResponse(BaseModel):
-    """Collaboration offering response model (admin - snake_case)"""
-    id: str
-    listing_id: str
-    collaboration_type: str
-    availability_months: List[str]
-    platforms: List[str]
-    free_stay_min_nights: Optional[int] = None
-    free_stay_max_nights: Optional[int] = None
-    paid_max_amount: Optional[Decimal] = None
-    discount_percentage: Optional[Decimal] = None
-    created_at: datetime
-    updated_at: datetime
-
-
-class AdminCreatorRequirementsResponse(BaseModel):
-    """Creator requirements response model (admin - snake_case)"""
-    id: str
-    listing_id: str
-    platforms: List[str]
-    min_followers: Optional[int] = None
-    top_countries: Optional[List[str]] = Field(None, alias="target_countries", description="Top Countries of the audience")
-    target_age_min: Optional[int] = None
-    target_age_max: Optional[int] = None
-    target_age_groups: Optional[List[str]] = None
-    created_at: datetime
-    updated_at: datetime
-
-
-class AdminListingResponse(BaseModel):
-    """Listing response model (admin - snake_case)"""
-    id: str
-    hotel_profile_id: str
-    name: str
-    location: str
-    description: Optional[str] = None
-    accommodation_type: str
-    images: List[str] = Field(default_factory=list)
-    status: str
-    created_at: datetime
-    updated_at: datetime
-    collaboration_offerings: List[AdminCollaborationOfferingResponse] = Field(default_factory=list)
-    creator_requirements: Optional[AdminCreatorRequirementsResponse] = None
-
-
 class HotelProfileDetail(BaseModel):
     """Hotel profile detail"""
     id: str
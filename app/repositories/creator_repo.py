@@ -7,6 +7,35 @@ import asyncpg
 
 from app.database import Database
 
+_PROFILE_DETAIL_COLUMNS = (
+    "id, user_id, location, short_description, portfolio_link, phone, profile_picture, "
+    "profile_complete, profile_completed_at, created_at, updated_at"
+)
+
+_WITH_PLATFORMS_BY_USER_ID_QUERY = """
+    SELECT {columns},
+           COALESCE(
+               (SELECT json_agg(json_build_object(
+                           'id', p.id,
+                           'name', p.name,
+                           'handle', p.handle,
+                           'followers', p.followers,
+                           'engagement_rate', p.engagement_rate,
+                           'top_countries', p.top_countries,
+                           'top_age_groups', p.top_age_groups,
+                           'gender_split', p.gender_split
+                       ) ORDER BY p.name)
+                FROM creator_platforms p
+                WHERE p.creator_id = creators.id),
+               '[]'::json
+           ) AS platforms
+    FROM creators
+    WHERE user_id = $1
+"""
+
+# Backs the admin user detail page; have each pool connection prepare it up front
+Database.warm_statements([(_WITH_PLATFORMS_BY_USER_ID_QUERY.format(columns=_PROFILE_DETAIL_COLUMNS), 1)])
+
 
 class CreatorRepository:
 
@@ -24,6 +53,24 @@ class CreatorRepository:
             row = await Database.fetchrow(query, user_id)
         return dict(row) if row else None
 
+    @staticmethod
+    async def get_with_platforms_by_user_id(
+        user_id: str,
+        *,
+        columns: str = _PROFILE_DETAIL_COLUMNS,
+        conn: Optional[asyncpg.Connection] = None,
+    ) -> Optional[dict]:
+        """Get a creator and its platforms in one round-trip.
+
+        ``platforms`` is a JSON array of the creator's platforms, ordered by name.
+        """
+        query = _WITH_PLATFORMS_BY_USER_ID_QUERY.format(columns=columns)
+        if conn:
+            row = await conn.fetchrow(query, user_id)
+        else:
+            row = await Database.fetchrow(query, user_id)
+        return dict(row) if row else None
+
     @staticmethod
     async def get_by_id(
         creator_id: str,
@@ -86,8 +133,16 @@ class CreatorRepository:
         creator_id: str,
         *,
         columns: str = "id, name, handle, followers, engagement_rate, top_countries, top_age_groups, gender_split",
+        with_audience_total: bool = False,
         conn: Optional[asyncpg.Connection] = None,
     ) -> list:
+        """Get a creator's platforms ordered by name.
+
+        With ``with_audience_total`` every row also carries ``audience_total``,
+        the creator's followers summed over all platforms.
+        """
+        if with_audience_total:
+            columns = f"{columns}, SUM(followers) OVER () AS audience_total"
         query = f"SELECT {columns} FROM creator_platforms WHERE creator_id = $1 ORDER BY name"
         if conn:
             rows = await conn.fetch(query, creator_id)
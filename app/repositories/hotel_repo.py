@@ -8,6 +8,72 @@ import asyncpg
 
 from app.database import Database
 
+_PROFILE_DETAIL_COLUMNS = "id, user_id, name, location, picture, website, about, phone, status, created_at, updated_at"
+
+# Timestamps inside the JSON tree are rendered in SQL as UTC with a "Z"
+# suffix, matching how the API encodes top-level datetimes; Postgres' own
+# JSON encoding would give "+00:00" offsets instead
+_PROFILE_WITH_LISTINGS_BY_USER_ID_QUERY = """
+    SELECT {columns},
+           COALESCE(
+               (SELECT json_agg(json_build_object(
+                           'id', l.id,
+                           'hotel_profile_id', l.hotel_profile_id,
+                           'name', l.name,
+                           'location', l.location,
+                           'description', l.description,
+                           'accommodation_type', l.accommodation_type,
+                           'images', COALESCE(l.images, '{{}}'),
+                           'status', l.status,
+                           'created_at', to_char(l.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"'),
+                           'updated_at', to_char(l.updated_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"'),
+                           'collaboration_offerings', COALESCE(
+                               (SELECT json_agg(json_build_object(
+                                           'id', o.id,
+                                           'listing_id', o.listing_id,
+                                           'collaboration_type', o.collaboration_type,
+                                           'availability_months', o.availability_months,
+                                           'platforms', o.platforms,
+                                           'free_stay_min_nights', o.free_stay_min_nights,
+                                           'free_stay_max_nights', o.free_stay_max_nights,
+                                           'paid_max_amount', o.paid_max_amount::text,
+                                           'discount_percentage', o.discount_percentage,
+                                           'created_at', to_char(o.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"'),
+                                           'updated_at', to_char(o.updated_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"')
+                                       ) ORDER BY o.created_at DESC)
+                                FROM listing_collaboration_offerings o
+                                WHERE o.listing_id = l.id),
+                               '[]'::json
+                           ),
+                           'creator_requirements',
+                               (SELECT json_build_object(
+                                           'id', r.id,
+                                           'listing_id', r.listing_id,
+                                           'platforms', r.platforms,
+                                           'min_followers', r.min_followers,
+                                           'target_countries', r.target_countries,
+                                           'target_age_min', r.target_age_min,
+                                           'target_age_max', r.target_age_max,
+                                           'target_age_groups', r.target_age_groups,
+                                           'creator_types', r.creator_types,
+                                           'created_at', to_char(r.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"'),
+                                           'updated_at', to_char(r.updated_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"')
+                                       )
+                                FROM listing_creator_requirements r
+                                WHERE r.listing_id = l.id
+                                LIMIT 1)
+                       ) ORDER BY l.created_at DESC)
+                FROM hotel_listings l
+                WHERE l.hotel_profile_id = hotel_profiles.id),
+               '[]'::json
+           ) AS listings
+    FROM hotel_profiles
+    WHERE user_id = $1
+"""
+
+# Backs the admin user detail page; have each pool connection prepare it up front
+Database.warm_statements([(_PROFILE_WITH_LISTINGS_BY_USER_ID_QUERY.format(columns=_PROFILE_DETAIL_COLUMNS), 1)])
+
 
 class HotelRepository:
 
@@ -27,6 +93,27 @@ class HotelRepository:
             row = await Database.fetchrow(query, user_id)
         return dict(row) if row else None
 
+    @staticmethod
+    async def get_profile_with_listings_by_user_id(
+        user_id: str,
+        *,
+        columns: str = _PROFILE_DETAIL_COLUMNS,
+        conn: Optional[asyncpg.Connection] = None,
+    ) -> Optional[dict]:
+        """Get a hotel profile and its whole listings tree in one round-trip.
+
+        ``listings`` is a JSON array of the profile's listings, newest first, each
+        carrying its ``collaboration_offerings`` (newest first) and
+        ``creator_requirements`` (or null). ``paid_max_amount`` is rendered as a
+        string so it isn't rounded through a float.
+        """
+        query = _PROFILE_WITH_LISTINGS_BY_USER_ID_QUERY.format(columns=columns)
+        if conn:
+            row = await conn.fetchrow(query, user_id)
+        else:
+            row = await Database.fetchrow(query, user_id)
+        return dict(row) if row else None
+
     @staticmethod
     async def get_profile_by_id(
         profile_id: str,
@@ -102,6 +189,36 @@ class HotelRepository:
             rows = await Database.fetch(query, profile_id)
         return [dict(r) for r in rows]
 
+    @staticmethod
+    async def get_listings_with_requirements_by_profile_id(
+        profile_id: str,
+        *,
+        conn: Optional[asyncpg.Connection] = None,
+    ) -> list:
+        """Get a hotel's listings, newest first, each joined with its creator requirements.
+
+        Requirements are 1:1 with listings; their columns come back prefixed with
+        ``req_`` and are all NULL (``req_id`` included) when a listing has none.
+        """
+        query = """
+            SELECT l.id, l.hotel_profile_id, l.name, l.location, l.description,
+                   l.accommodation_type, l.images, l.status, l.created_at, l.updated_at,
+                   r.id AS req_id, r.platforms AS req_platforms, r.min_followers AS req_min_followers,
+                   r.target_countries AS req_target_countries, r.target_age_min AS req_target_age_min,
+                   r.target_age_max AS req_target_age_max, r.target_age_groups AS req_target_age_groups,
+                   r.creator_types AS req_creator_types, r.created_at AS req_created_at,
+                   r.updated_at AS req_updated_at
+            FROM hotel_listings l
+            LEFT JOIN listing_creator_requirements r ON r.listing_id = l.id
+            WHERE l.hotel_profile_id = $1
+            ORDER BY l.created_at DESC
+        """
+        if conn:
+            rows = await conn.fetch(query, profile_id)
+        else:
+            rows = await Database.fetch(query, profile_id)
+        return [dict(r) for r in rows]
+
     @staticmethod
     async def get_listing(
         listing_id: str,
@@ -336,19 +453,18 @@ class HotelRepository:
         """Batch-fetch offerings for multiple listings."""
         if not listing_ids:
             return []
-        placeholders = ','.join([f'${i+1}' for i in range(len(listing_ids))])
-        query = f"""
+        query = """
             SELECT id, listing_id, collaboration_type, availability_months, platforms,
                    free_stay_min_nights, free_stay_max_nights, paid_max_amount, discount_percentage,
                    created_at, updated_at
             FROM listing_collaboration_offerings
-            WHERE listing_id IN ({placeholders})
+            WHERE listing_id = ANY($1::uuid[])
             ORDER BY listing_id, created_at DESC
         """
         if conn:
-            rows = await conn.fetch(query, *listing_ids)
+            rows = await conn.fetch(query, listing_ids)
         else:
-            rows = await Database.fetch(query, *listing_ids)
+            rows = await Database.fetch(query, listing_ids)
         return [dict(r) for r in rows]
 
     @staticmethod
@@ -360,15 +476,14 @@ class HotelRepository:
         """Batch-fetch requirements for multiple listings."""
         if not listing_ids:
             return []
-        placeholders = ','.join([f'${i+1}' for i in range(len(listing_ids))])
-        query = f"""
+        query = """
             SELECT id, listing_id, platforms, min_followers, target_countries,
                    target_age_min, target_age_max, target_age_groups, creator_types, created_at, updated_at
             FROM listing_creator_requirements
-            WHERE listing_id IN ({placeholders})
+            WHERE listing_id = ANY($1::uuid[])
         """
         if conn:
-            rows = await conn.fetch(query, *listing_ids)
+            rows = await conn.fetch(query, listing_ids)
         else:
-            rows = await Database.fetch(query, *listing_ids)
+            rows = await Database.fetch(query, listing_ids)
         return [dict(r) for r in rows]
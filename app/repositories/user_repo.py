@@ -7,6 +7,18 @@ import asyncpg
 
 from app.database import AuthDatabase
 
+_GET_BY_ID_QUERY = "SELECT {columns} FROM users WHERE id = $1"
+
+_DETAIL_COLUMNS = "id, email, name, type, status, email_verified, avatar, created_at, updated_at"
+
+# The auth dependencies look a user up by id with the short column lists on
+# every authenticated request, and the admin user detail page with the full
+# one; have each pool connection prepare them up front
+AuthDatabase.warm_statements(
+    (_GET_BY_ID_QUERY.format(columns=columns), 1)
+    for columns in ("id", "id, type", "id, type, status", _DETAIL_COLUMNS)
+)
+
 
 class UserRepository:
 
@@ -28,7 +40,7 @@ class UserRepository:
         columns: str = "*",
         conn: Optional[asyncpg.Connection] = None,
     ) -> Optional[dict]:
-        query = f"SELECT {columns} FROM users WHERE id = $1"
+        query = _GET_BY_ID_QUERY.format(columns=columns)
         if conn:
             row = await conn.fetchrow(query, user_id)
         else:
@@ -1,19 +1,31 @@
 """
 Admin routes for user management
 """
-from fastapi import APIRouter, HTTPException, status as http_status, Depends, Query
-from typing import List, Literal, Optional, Union
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Response, status as http_status, Depends, Query
+from fastapi.responses import ORJSONResponse
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 from datetime import datetime
 from decimal import Decimal
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
+import asyncio
+import asyncpg
+import base64
+import functools
 import logging
 import json
+import orjson
 import bcrypt
+import uuid
 
+from app.cache import TTLCache
 from app.database import Database, AuthDatabase
-from app.dependencies import get_current_user_id
-from app.routers.collaborations import get_collaboration_deliverables
-from app.s3_service import delete_all_objects_in_prefix, delete_file_from_s3, extract_key_from_url
+from app.dependencies import get_current_user
+from app.routers.collaborations import get_collaboration_deliverables_bulk
+from app.s3_service import (
+    delete_all_objects_in_prefix,
+    delete_files_from_s3_batch,
+    extract_key_from_url,
+)
 from app.repositories.user_repo import UserRepository
 from app.repositories.creator_repo import CreatorRepository
 from app.repositories.hotel_repo import HotelRepository
@@ -41,11 +53,6 @@ from app.models.admin import (
     CreateUserRequest,
     UpdateUserRequest,
     AdminPlatformResponse,
-    CreatorProfileDetail,
-    AdminCollaborationOfferingResponse,
-    AdminCreatorRequirementsResponse,
-    AdminListingResponse,
-    HotelProfileDetail,
     UserDetailResponse,
 )
 
@@ -54,33 +61,246 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
-# Admin dependency - checks if user is admin
-async def get_admin_user(user_id: str = Depends(get_current_user_id)) -> str:
-    """
-    Verify that the current user is an admin.
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class _AdminJSONResponse(ORJSONResponse):
+    """orjson response for handlers that return raw rows instead of models.
+
+    Writes UTC datetimes with a trailing ``Z`` and Decimals (e.g. NUMERIC
+    amounts) as strings, as Pydantic does, so the output matches the
+    model-serialized endpoints. orjson rejects Decimal on its own.
     """
-    user = await UserRepository.get_by_id(user_id, columns="id, type, status")
 
-    if not user:
-        raise HTTPException(
-            status_code=http_status.HTTP_404_NOT_FOUND,
-            detail="User not found"
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
         )
 
+
+def _model_response(model: BaseModel, status_code: int = http_status.HTTP_200_OK) -> _AdminJSONResponse:
+    """Serialize an already-built response model, bypassing FastAPI's response_model.
+
+    FastAPI would validate the returned model against ``response_model`` again
+    before serializing it. Models built with ``model_construct`` from our own
+    rows don't need that, so dump them the way FastAPI would (JSON mode, by
+    alias) and hand the result straight to the response. ``response_model``
+    stays on the route for the OpenAPI schema.
+    """
+    return _AdminJSONResponse(model.model_dump(mode='json', by_alias=True), status_code=status_code)
+
+
+def _user_payload(user) -> dict:
+    """UserResponse-shaped dict for a users row; datetimes are left for orjson to encode"""
+    return {
+        "id": user['id'],
+        "email": user['email'],
+        "name": user['name'],
+        "type": user['type'],
+        "status": user['status'],
+        "email_verified": user['email_verified'],
+        "avatar": user['avatar'],
+        "created_at": user['created_at'],
+        "updated_at": user['updated_at']
+    }
+
+
+def _platform_payload(p) -> dict:
+    """PlatformResponse-shaped dict for a creator_platforms row (or its JSON form)"""
+    return {
+        "id": p['id'],
+        "name": p['name'],
+        "handle": p['handle'],
+        "followers": p['followers'],
+        "engagement_rate": float(p['engagement_rate']),
+        "top_countries": _convert_top_countries(p['top_countries']),
+        "top_age_groups": _convert_top_age_groups(p['top_age_groups']),
+        "gender_split": p['gender_split']
+    }
+
+
+def _convert_top_countries(value):
+    """Convert top_countries from dict to list format if needed"""
+    if isinstance(value, dict):
+        # Convert dict {"USA": 40, "UK": 25} to [{"country": "USA", "percentage": 40}, ...]
+        return [{"country": k, "percentage": v} for k, v in value.items()]
+    return value
+
+
+def _convert_top_age_groups(value):
+    """Convert top_age_groups from dict to list format if needed"""
+    if isinstance(value, dict):
+        # Convert dict {"25-34": 45, "35-44": 30} to [{"ageRange": "25-34", "percentage": 45}, ...]
+        return [{"ageRange": k, "percentage": v} for k, v in value.items()]
+    return value
+
+
+# Request field -> (column, caster) for each admin dynamic UPDATE, in SET order.
+# Column names are hard-coded here, so SQL strings are drawn from a closed set
+# of 2^K template variants (one per combination of provided fields), which
+# keeps asyncpg's prepared-statement cache effective; request values only
+# ever travel as positional parameters.
+def _identity(value):
+    return value
+
+
+_UPDATE_FIELD_MAP: Dict[str, Tuple[Tuple[str, str, Callable[[Any], Any]], ...]] = {
+    "users": (
+        ("name", "name", _identity),
+        ("email", "email", _identity),
+        ("status", "status", _identity),
+        ("emailVerified", "email_verified", _identity),
+        ("avatar", "avatar", _identity),
+    ),
+    "creators": (
+        ("location", "location", _identity),
+        ("shortDescription", "short_description", _identity),
+        ("portfolioLink", "portfolio_link", str),
+        ("phone", "phone", _identity),
+        ("profilePicture", "profile_picture", _identity),
+        ("creatorType", "creator_type", _identity),
+    ),
+    "hotel_profiles": (
+        ("name", "name", _identity),
+        ("location", "location", _identity),
+        ("about", "about", _identity),
+        ("website", "website", str),
+        ("phone", "phone", _identity),
+        ("picture", "picture", str),
+    ),
+    "hotel_listings": (
+        ("name", "name", _identity),
+        ("location", "location", _identity),
+        ("description", "description", _identity),
+        ("accommodationType", "accommodation_type", _identity),
+        ("images", "images", _identity),
+    ),
+}
+
+
+# Tables whose UPDATE returns the post-image, so the handler can skip a re-read
+_UPDATE_RETURNING = {
+    "users": "id, email, name, type, status, email_verified, avatar, created_at, updated_at",
+    "hotel_listings": "id, hotel_profile_id, name, location, description, accommodation_type, images, status, created_at, updated_at",
+}
+
+
+def _compute_mask(request, table: str) -> int:
+    """Bitmask of the mapped request fields that were provided (not None)."""
+    mask = 0
+    for bit, (attr, _, _) in enumerate(_UPDATE_FIELD_MAP[table]):
+        if getattr(request, attr) is not None:
+            mask |= 1 << bit
+    return mask
+
+
+@functools.cache
+def _update_plan(mask: int, table: str) -> Tuple[str, Tuple[str, ...], Tuple[Callable[[Any], Any], ...]]:
+    """Return the UPDATE statement, request attributes and casters for a field mask.
+
+    The statement takes the casted values as $1..$n and the row id as $n+1.
+    """
+    active = [field for bit, field in enumerate(_UPDATE_FIELD_MAP[table]) if mask & (1 << bit)]
+    assignments = [f"{column} = ${index}" for index, (_, column, _) in enumerate(active, start=1)]
+    assignments.append("updated_at = now()")
+    sql = f"UPDATE {table} SET {', '.join(assignments)} WHERE id = ${len(active) + 1}"
+    if table in _UPDATE_RETURNING:
+        sql += f" RETURNING {_UPDATE_RETURNING[table]}"
+    return sql, tuple(attr for attr, _, _ in active), tuple(caster for _, _, caster in active)
+
+
+def _update_values(request, attrs: Tuple[str, ...], casters: Tuple[Callable[[Any], Any], ...]) -> list:
+    """Cast the provided request fields into positional UPDATE parameters."""
+    return [caster(getattr(request, attr)) for attr, caster in zip(attrs, casters)]
+
+
+# Admin dependency - checks if user is admin
+async def get_admin_user(user: dict = Depends(get_current_user)) -> str:
+    """
+    Verify that the current user is an admin.
+
+    get_current_user has already rejected missing and non-verified
+    (including suspended) accounts; its row is reused rather than read again.
+    """
     if user['type'] != 'admin':
         raise HTTPException(
             status_code=http_status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
         )
 
-    if user['status'] == 'suspended':
+    return user['id']
+
+
+# Rendered users list pages keyed by their query parameters. Dashboards poll
+# the same first pages repeatedly; admin writes to users clear the cache and
+# anything else (sign-ups, profile edits) shows up within the TTL
+_users_list_cache = TTLCache(maxsize=256, ttl=10)
+
+
+@functools.cache
+def _users_list_queries(has_type: bool, has_status: bool, has_search: bool, keyset: bool = False) -> Tuple[str, str]:
+    """Return the (page, count) queries for the admin users list filter combination.
+
+    Filter values are bound in order (type, status, search pattern). The page
+    query then takes either LIMIT and OFFSET, or, for ``keyset``, the cursor's
+    created_at and id followed by LIMIT. Without filters the WHERE clause is
+    left out entirely.
+    """
+    columns = [column for column, present in (("type", has_type), ("status", has_status)) if present]
+    conditions = [f"{column} = ${index}" for index, column in enumerate(columns, start=1)]
+    if has_search:
+        # Use the same placeholder for both name and email comparisons
+        index = len(conditions) + 1
+        conditions.append(f"(name ILIKE ${index} OR email ILIKE ${index})")
+
+    count_where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    count_query = f"SELECT COUNT(*) as total FROM users {count_where}"
+
+    next_index = len(conditions) + 1
+    if keyset:
+        # Seek past the cursor row instead of scanning and discarding OFFSET rows
+        conditions.append(f"(created_at, id) < (${next_index}, ${next_index + 1})")
+        window = ""
+        paging = f"LIMIT ${next_index + 2}"
+    else:
+        window = ", COUNT(*) OVER () as total_count"
+        paging = f"LIMIT ${next_index} OFFSET ${next_index + 1}"
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    users_query = f"""
+        SELECT id, email, name, type, status, email_verified, avatar, created_at, updated_at{window}
+        FROM users
+        {where}
+        ORDER BY created_at DESC, id DESC
+        {paging}
+    """
+    return users_query, count_query
+
+
+def _encode_users_cursor(row) -> str:
+    """Opaque cursor pointing just past ``row`` in the users list order"""
+    raw = json.dumps([row['created_at'].isoformat(), row['id']])
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def _decode_users_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Inverse of _encode_users_cursor; raises 400 for a malformed cursor"""
+    try:
+        created_at, user_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        if not (isinstance(created_at, str) and isinstance(user_id, str)):
+            raise ValueError("cursor fields must be strings")
+        return datetime.fromisoformat(created_at), str(uuid.UUID(user_id))
+    except (ValueError, TypeError, UnicodeError):
         raise HTTPException(
-            status_code=http_status.HTTP_403_FORBIDDEN,
-            detail="Admin account is suspended"
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
         )
 
-    return user_id
-
 
 @router.get("/users", response_model=UserListResponse, status_code=http_status.HTTP_200_OK)
 async def get_users(
@@ -89,6 +309,7 @@ async def get_users(
     type: Optional[Literal["creator", "hotel", "admin"]] = Query(None, description="Filter by user type"),
     status: Optional[Literal["pending", "verified", "rejected", "suspended"]] = Query(None, description="Filter by status"),
     search: Optional[str] = Query(None, description="Search by name or email"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous response's next_cursor; takes precedence over page"),
     admin_id: str = Depends(get_admin_user)
 ):
     """
@@ -99,69 +320,58 @@ async def get_users(
     - **type**: Filter by user type (creator, hotel, admin)
     - **status**: Filter by status (pending, verified, rejected, suspended)
     - **search**: Search by name or email
+    - **cursor**: Continue after the last user of a previous page (keyset pagination).
+      Deep pages are as cheap as the first one, unlike large page numbers.
     """
     try:
-        # Build WHERE clause
-        where_conditions = []
-        params = []
-        param_counter = 1
-        
-        if type:
-            where_conditions.append(f"type = ${param_counter}")
-            params.append(type)
-            param_counter += 1
-        
-        if status:
-            where_conditions.append(f"status = ${param_counter}")
-            params.append(status)
-            param_counter += 1
-        
-        if search:
-            # Use the same placeholder for both name and email comparisons
-            where_conditions.append(f"(name ILIKE ${param_counter} OR email ILIKE ${param_counter})")
-            search_pattern = f"%{search}%"
-            params.append(search_pattern)
-            param_counter += 1
-        
-        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-        
-        # Get total count
-        count_query = f"SELECT COUNT(*) as total FROM users WHERE {where_clause}"
-        total_result = await AuthDatabase.fetchrow(count_query, *params)
-        total = total_result['total'] if total_result else 0
+        cache_key = (page, page_size, type, status, search, cursor)
+        cached_body = _users_list_cache.get(cache_key)
+        if cached_body is not None:
+            return Response(content=cached_body, media_type="application/json")
 
-        # Get users with pagination
-        offset = (page - 1) * page_size
-        users_query = f"""
-            SELECT id, email, name, type, status, email_verified, avatar, created_at, updated_at
-            FROM users
-            WHERE {where_clause}
-            ORDER BY created_at DESC
-            LIMIT ${param_counter} OFFSET ${param_counter + 1}
-        """
-        params.extend([page_size, offset])
-        
-        users_data = await AuthDatabase.fetch(users_query, *params)
+        params = [value for value in (type, status) if value]
+        if search:
+            params.append(f"%{search}%")
+        users_query, count_query = _users_list_queries(
+            bool(type), bool(status), bool(search), keyset=cursor is not None
+        )
         
-        users = [
-            UserResponse(
-                id=str(u['id']),
-                email=u['email'],
-                name=u['name'],
-                type=u['type'],
-                status=u['status'],
-                email_verified=u['email_verified'],
-                avatar=u['avatar'],
-                created_at=u['created_at'],
-                updated_at=u['updated_at']
+        if cursor is not None:
+            cursor_created_at, cursor_id = _decode_users_cursor(cursor)
+            # The page no longer covers the whole filter, so count separately
+            # while the page is fetched
+            users_data, total = await asyncio.gather(
+                AuthDatabase.fetch_ro(users_query, *params, cursor_created_at, cursor_id, page_size),
+                AuthDatabase.fetchval_ro(count_query, *params)
             )
-            for u in users_data
-        ]
+        else:
+            # Get users with pagination; the window count carries the filtered
+            # total on every row, so the filter is evaluated once
+            offset = (page - 1) * page_size
+            users_data = await AuthDatabase.fetch_ro(users_query, *params, page_size, offset)
+
+            if users_data:
+                total = users_data[0]['total_count']
+            elif offset:
+                # Page past the end returns no rows to carry the window count
+                total = await AuthDatabase.fetchval_ro(count_query, *params)
+            else:
+                total = 0
+        
+        # Rows come straight from the database in the UserListResponse shape,
+        # so they are serialized as plain dicts without building models
+        users = [_user_payload(u) for u in users_data]
         
         logger.info(f"Admin {admin_id} fetched users list (page {page}, total: {total})")
         
-        return UserListResponse(users=users, total=total)
+        next_cursor = _encode_users_cursor(users_data[-1]) if len(users_data) == page_size else None
+        
+        response = _AdminJSONResponse({"users": users, "total": total, "next_cursor": next_cursor})
+        _users_list_cache.set(cache_key, response.body)
+        return response
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching users: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -183,11 +393,14 @@ async def get_user_details(
     - Listings (for hotels)
     """
     try:
-        # Get user info
-        user = await UserRepository.get_by_id(
-            user_id,
-            columns="id, email, name, type, status, email_verified, avatar, created_at, updated_at"
-        )
+        # Get user info (read-only, so the replica can serve it)
+        read_pool = await AuthDatabase.get_read_pool()
+        async with read_pool.acquire() as conn:
+            user = await UserRepository.get_by_id(
+                user_id,
+                columns="id, email, name, type, status, email_verified, avatar, created_at, updated_at",
+                conn=conn
+            )
 
         if not user:
             raise HTTPException(
@@ -197,180 +410,56 @@ async def get_user_details(
 
         profile = None
 
-        # Get profile based on user type
+        # Everything below comes from our own schema, so the response is
+        # assembled as plain dicts in the UserDetailResponse wire shape (field
+        # aliases as keys) instead of building a model per platform, offering
+        # and listing
         if user['type'] == 'creator':
-            # Get creator profile
-            creator_profile = await CreatorRepository.get_by_user_id(
-                user_id,
-                columns="id, user_id, location, short_description, portfolio_link, phone, profile_picture, profile_complete, profile_completed_at, created_at, updated_at"
-            )
+            # Get creator profile together with its platforms
+            creator_profile = await CreatorRepository.get_with_platforms_by_user_id(user_id)
 
             if creator_profile:
-                # Get platforms
-                platforms_data = await CreatorRepository.get_platforms(
-                    creator_profile['id'],
-                    columns="id, name, handle, followers, engagement_rate, top_countries, top_age_groups, gender_split, created_at, updated_at"
-                )
-                
-                platforms = []
-                for p in platforms_data:
-                    # Parse JSONB fields (asyncpg may return them as strings)
-                    def parse_jsonb(value):
-                        if value is None:
-                            return None
-                        if isinstance(value, str):
-                            return json.loads(value)
-                        return value
-                    
-                    # Convert top_countries from dict to list format if needed
-                    def convert_top_countries(value):
-                        parsed = parse_jsonb(value)
-                        if parsed is None:
-                            return None
-                        if isinstance(parsed, dict):
-                            # Convert dict {"USA": 40, "UK": 25} to [{"country": "USA", "percentage": 40}, ...]
-                            return [{"country": k, "percentage": v} for k, v in parsed.items()]
-                        return parsed
-                    
-                    # Convert top_age_groups from dict to list format if needed
-                    def convert_top_age_groups(value):
-                        parsed = parse_jsonb(value)
-                        if parsed is None:
-                            return None
-                        if isinstance(parsed, dict):
-                            # Convert dict {"25-34": 45, "35-44": 30} to [{"ageRange": "25-34", "percentage": 45}, ...]
-                            return [{"ageRange": k, "percentage": v} for k, v in parsed.items()]
-                        return parsed
-                    
-                    platforms.append(PlatformResponse(
-                        id=str(p['id']),
-                        name=p['name'],
-                        handle=p['handle'],
-                        followers=p['followers'],
-                        engagement_rate=float(p['engagement_rate']),
-                        top_countries=convert_top_countries(p['top_countries']),
-                        top_age_groups=convert_top_age_groups(p['top_age_groups']),
-                        gender_split=parse_jsonb(p['gender_split']),
-                        created_at=p['created_at'],
-                        updated_at=p['updated_at']
-                    ))
-                
-                profile = CreatorProfileDetail(
-                    id=str(creator_profile['id']),
-                    userId=str(creator_profile['user_id']),
-                    location=creator_profile['location'],
-                    shortDescription=creator_profile['short_description'],
-                    portfolioLink=creator_profile['portfolio_link'],
-                    phone=creator_profile['phone'],
-                    profilePicture=creator_profile['profile_picture'],
-                    profileComplete=creator_profile['profile_complete'],
-                    profileCompletedAt=creator_profile['profile_completed_at'],
-                    createdAt=creator_profile['created_at'],
-                    updatedAt=creator_profile['updated_at'],
-                    platforms=platforms
-                )
+                profile = {
+                    "id": creator_profile['id'],
+                    "user_id": creator_profile['user_id'],
+                    "location": creator_profile['location'],
+                    "short_description": creator_profile['short_description'],
+                    "portfolio_link": creator_profile['portfolio_link'],
+                    "phone": creator_profile['phone'],
+                    "profile_picture": creator_profile['profile_picture'],
+                    "profile_complete": creator_profile['profile_complete'],
+                    "profile_completed_at": creator_profile['profile_completed_at'],
+                    "created_at": creator_profile['created_at'],
+                    "updated_at": creator_profile['updated_at'],
+                    "platforms": [_platform_payload(p) for p in creator_profile['platforms']]
+                }
         
         elif user['type'] == 'hotel':
             # Get hotel profile (email comes from users table, not hotel_profiles)
-            hotel_profile = await HotelRepository.get_profile_by_user_id(
-                user_id,
-                columns="id, user_id, name, location, picture, website, about, phone, status, created_at, updated_at"
-            )
+            # with its listings, offerings and requirements already nested by
+            # Postgres, in one round-trip
+            hotel_profile = await HotelRepository.get_profile_with_listings_by_user_id(user_id)
 
             if hotel_profile:
-                # Get listings
-                listings_data = await HotelRepository.get_listings_by_profile_id(
-                    hotel_profile['id'],
-                    columns="id, hotel_profile_id, name, location, description, accommodation_type, images, status, created_at, updated_at"
-                )
-                
-                listings = []
-                for l in listings_data:
-                    listing_id = str(l['id'])
-                    
-                    # Get collaboration offerings for this listing
-                    offerings_data = await HotelRepository.get_offerings(l['id'])
-                    
-                    offerings = [
-                        CollaborationOfferingResponse(
-                            id=str(o['id']),
-                            listing_id=str(o['listing_id']),
-                            collaboration_type=o['collaboration_type'],
-                            availability_months=o['availability_months'],
-                            platforms=o['platforms'],
-                            free_stay_min_nights=o['free_stay_min_nights'],
-                            free_stay_max_nights=o['free_stay_max_nights'],
-                            paid_max_amount=o['paid_max_amount'],
-                            discount_percentage=o['discount_percentage'],
-                            created_at=o['created_at'],
-                            updated_at=o['updated_at']
-                        )
-                        for o in offerings_data
-                    ]
-                    
-                    # Get creator requirements for this listing
-                    requirements_data = await HotelRepository.get_requirements(l['id'])
-                    
-                    requirements = None
-                    if requirements_data:
-                        requirements = CreatorRequirementsResponse(
-                            id=str(requirements_data['id']),
-                            listing_id=str(requirements_data['listing_id']),
-                            platforms=requirements_data['platforms'],
-                            min_followers=requirements_data['min_followers'],
-                            top_countries=requirements_data['target_countries'],
-                            target_age_min=requirements_data['target_age_min'],
-                            target_age_max=requirements_data['target_age_max'],
-                            target_age_groups=requirements_data['target_age_groups'],
-                            created_at=requirements_data['created_at'],
-                            updated_at=requirements_data['updated_at']
-                        )
-                    
-                    listings.append(ListingResponse(
-                        id=listing_id,
-                        hotel_profile_id=str(l['hotel_profile_id']),
-                        name=l['name'],
-                        location=l['location'],
-                        description=l['description'],
-                        accommodation_type=l['accommodation_type'],
-                        images=l['images'] or [],
-                        status=l['status'],
-                        created_at=l['created_at'],
-                        updated_at=l['updated_at'],
-                        collaboration_offerings=offerings,
-                        creator_requirements=requirements
-                    ))
-                
-                profile = HotelProfileDetail(
-                    id=str(hotel_profile['id']),
-                    user_id=str(hotel_profile['user_id']),
-                    name=hotel_profile['name'],
-                    location=hotel_profile['location'],
-                    picture=hotel_profile['picture'],
-                    website=hotel_profile['website'],
-                    about=hotel_profile['about'],
-                    email=user['email'],  # Email comes from users table
-                    phone=hotel_profile['phone'],
-                    status=hotel_profile['status'],
-                    created_at=hotel_profile['created_at'],
-                    updated_at=hotel_profile['updated_at'],
-                    listings=listings
-                )
+                profile = {
+                    "id": hotel_profile['id'],
+                    "user_id": hotel_profile['user_id'],
+                    "name": hotel_profile['name'],
+                    "location": hotel_profile['location'],
+                    "picture": hotel_profile['picture'],
+                    "website": hotel_profile['website'],
+                    "about": hotel_profile['about'],
+                    "email": user['email'],  # Email comes from users table
+                    "phone": hotel_profile['phone'],
+                    "status": hotel_profile['status'],
+                    "created_at": hotel_profile['created_at'],
+                    "updated_at": hotel_profile['updated_at'],
+                    "listings": hotel_profile['listings']
+                }
         
         logger.info(f"Admin {admin_id} fetched details for user {user_id} (type: {user['type']})")
         
-        return UserDetailResponse(
-            id=str(user['id']),
-            email=user['email'],
-            name=user['name'],
-            type=user['type'],
-            status=user['status'],
-            email_verified=user['email_verified'],
-            avatar=user['avatar'],
-            created_at=user['created_at'],
-            updated_at=user['updated_at'],
-            profile=profile
-        )
+        return _AdminJSONResponse({**_user_payload(user), "profile": profile})
         
     except HTTPException:
         raise
@@ -401,24 +490,21 @@ async def create_user(
     - **hotelProfile**: Optional hotel profile data (only for hotel type)
     """
     try:
-        # Check if email already exists
-        if await UserRepository.exists_by_email(request.email):
-            raise HTTPException(
-                status_code=http_status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        
-        # Hash password
-        password_hash = bcrypt.hashpw(
+        # Hash password in a worker thread; bcrypt is deliberately slow and
+        # would otherwise stall every other request on the event loop
+        password_hash = (await asyncio.to_thread(
+            bcrypt.hashpw,
             request.password.encode('utf-8'),
             bcrypt.gensalt()
-        ).decode('utf-8')
+        )).decode('utf-8')
         
-        # Insert user into auth database
+        # Insert user into auth database; the unique email constraint doubles
+        # as the duplicate check, so no separate lookup (or race) is needed
         user = await AuthDatabase.fetchrow(
             """
             INSERT INTO users (email, password_hash, name, type, status, email_verified, avatar)
             VALUES ($1, $2, $3, $4, $5, $6, $7)
+            ON CONFLICT (email) DO NOTHING
             RETURNING id, email, name, type, status, email_verified, avatar, created_at, updated_at
             """,
             request.email,
@@ -430,82 +516,100 @@ async def create_user(
             request.avatar
         )
         
+        if not user:
+            raise HTTPException(
+                status_code=http_status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
+        
         user_id = user['id']
 
         try:
-            # Create profile based on user type (on business Database)
-            if request.type == "creator":
-                # Create creator profile
-                profile_data = request.creatorProfile or CreateCreatorProfileRequest()
-
-                creator = await Database.fetchrow(
-                    """
-                    INSERT INTO creators (user_id, location, short_description, portfolio_link, phone, profile_picture)
-                    VALUES ($1, $2, $3, $4, $5, $6)
-                    RETURNING id
-                    """,
-                    user_id,
-                    profile_data.location,
-                    profile_data.shortDescription,
-                    profile_data.portfolioLink,
-                    profile_data.phone,
-                    profile_data.profilePicture
-                )
-
-                creator_id = creator['id']
-
-                # Create platforms if provided
-                if profile_data.platforms:
-                    for platform in profile_data.platforms:
-                        # Prepare analytics data as JSONB
-                        top_countries_data = None
-                        if platform.topCountries:
-                            top_countries_data = json.dumps(platform.topCountries)
-
-                        top_age_groups_data = None
-                        if platform.topAgeGroups:
-                            top_age_groups_data = json.dumps(platform.topAgeGroups)
-
-                        gender_split_data = None
-                        if platform.genderSplit:
-                            gender_split_data = json.dumps(platform.genderSplit)
-
-                        await CreatorRepository.insert_platform(
-                            creator_id,
-                            platform.name,
-                            platform.handle,
-                            platform.followers,
-                            Decimal(str(platform.engagementRate)),
-                            top_countries_data,
-                            top_age_groups_data,
-                            gender_split_data
+            # Create profile based on user type (on business Database). The
+            # profile and everything under it go in one transaction, so a
+            # failure leaves no partial profile behind
+            pool = await Database.get_pool()
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    if request.type == "creator":
+                        # Create creator profile
+                        profile_data = request.creatorProfile or CreateCreatorProfileRequest()
+
+                        creator = await conn.fetchrow(
+                            """
+                            INSERT INTO creators (user_id, location, short_description, portfolio_link, phone, profile_picture)
+                            VALUES ($1, $2, $3, $4, $5, $6)
+                            RETURNING id
+                            """,
+                            user_id,
+                            profile_data.location,
+                            profile_data.shortDescription,
+                            profile_data.portfolioLink,
+                            profile_data.phone,
+                            profile_data.profilePicture
                         )
 
-            elif request.type == "hotel":
-                # Create hotel profile
-                profile_data = request.hotelProfile or CreateHotelProfileRequest()
-
-                hotel_profile = await Database.fetchrow(
-                    """
-                    INSERT INTO hotel_profiles (user_id, name, location, about, website, phone)
-                    VALUES ($1, $2, $3, $4, $5, $6)
-                    RETURNING id
-                    """,
-                    user_id,
-                    profile_data.name or request.name,
-                    profile_data.location or "Not specified",
-                    profile_data.about,
-                    profile_data.website,
-                    profile_data.phone
-                )
+                        creator_id = creator['id']
+
+                        # Create platforms if provided, in one pipelined batch
+                        if profile_data.platforms:
+                            platform_rows = []
+                            for platform in profile_data.platforms:
+                                # Prepare analytics data as JSONB
+                                top_countries_data = None
+                                if platform.topCountries:
+                                    top_countries_data = json.dumps(platform.topCountries)
+
+                                top_age_groups_data = None
+                                if platform.topAgeGroups:
+                                    top_age_groups_data = json.dumps(platform.topAgeGroups)
+
+                                gender_split_data = None
+                                if platform.genderSplit:
+                                    gender_split_data = json.dumps(platform.genderSplit)
+
+                                platform_rows.append((
+                                    creator_id,
+                                    platform.name,
+                                    platform.handle,
+                                    platform.followers,
+                                    Decimal(str(platform.engagementRate)),
+                                    top_countries_data,
+                                    top_age_groups_data,
+                                    gender_split_data
+                                ))
+
+                            await conn.executemany(
+                                """
+                                INSERT INTO creator_platforms
+                                (creator_id, name, handle, followers, engagement_rate, top_countries, top_age_groups, gender_split)
+                                VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                                """,
+                                platform_rows
+                            )
+
+                    elif request.type == "hotel":
+                        # Create hotel profile
+                        profile_data = request.hotelProfile or CreateHotelProfileRequest()
+
+                        hotel_profile = await conn.fetchrow(
+                            """
+                            INSERT INTO hotel_profiles (user_id, name, location, about, website, phone)
+                            VALUES ($1, $2, $3, $4, $5, $6)
+                            RETURNING id
+                            """,
+                            user_id,
+                            profile_data.name or request.name,
+                            profile_data.location or "Not specified",
+                            profile_data.about,
+                            profile_data.website,
+                            profile_data.phone
+                        )
 
-                hotel_profile_id = hotel_profile['id']
+                        hotel_profile_id = hotel_profile['id']
 
-                # Create listings if provided
-                if profile_data.listings:
-                    pool = await Database.get_pool()
-                    async with pool.acquire() as conn:
-                        async with conn.transaction():
+                        # Create listings if provided
+                        if profile_data.listings:
                             for listing_request in profile_data.listings:
                                 # Create listing
                                 listing = await conn.fetchrow(
@@ -525,24 +629,28 @@ async def create_user(
 
                                 listing_id = listing['id']
 
-                                # Create collaboration offerings
-                                for offering in listing_request.collaborationOfferings:
-                                    await conn.execute(
-                                        """
-                                        INSERT INTO listing_collaboration_offerings
-                                        (listing_id, collaboration_type, availability_months, platforms,
-                                         free_stay_min_nights, free_stay_max_nights, paid_max_amount, discount_percentage)
-                                        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                                        """,
-                                        listing_id,
-                                        offering.collaborationType,
-                                        offering.availabilityMonths,
-                                        offering.platforms,
-                                        offering.freeStayMinNights,
-                                        offering.freeStayMaxNights,
-                                        offering.paidMaxAmount,
-                                        offering.discountPercentage
-                                    )
+                                # Create collaboration offerings in one pipelined batch
+                                await conn.executemany(
+                                    """
+                                    INSERT INTO listing_collaboration_offerings
+                                    (listing_id, collaboration_type, availability_months, platforms,
+                                     free_stay_min_nights, free_stay_max_nights, paid_max_amount, discount_percentage)
+                                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                                    """,
+                                    [
+                                        (
+                                            listing_id,
+                                            offering.collaborationType,
+                                            offering.availabilityMonths,
+                                            offering.platforms,
+                                            offering.freeStayMinNights,
+                                            offering.freeStayMaxNights,
+                                            offering.paidMaxAmount,
+                                            offering.discountPercentage
+                                        )
+                                        for offering in listing_request.collaborationOfferings
+                                    ]
+                                )
 
                                 # Create creator requirements
                                 await conn.execute(
@@ -564,19 +672,11 @@ async def create_user(
             await UserRepository.delete(user_id)
             raise
         
+        _users_list_cache.clear()
+        
         logger.info(f"Admin {admin_id} created user {user_id} (type: {request.type})")
         
-        return UserResponse(
-            id=str(user['id']),
-            email=user['email'],
-            name=user['name'],
-            type=user['type'],
-            status=user['status'],
-            email_verified=user['email_verified'],
-            avatar=user['avatar'],
-            created_at=user['created_at'],
-            updated_at=user['updated_at']
-        )
+        return _AdminJSONResponse(_user_payload(user), status_code=http_status.HTTP_201_CREATED)
         
     except HTTPException:
         raise
@@ -618,8 +718,8 @@ async def update_creator_profile(
     - Option 2: Provide an existing S3 URL directly in profilePicture field
     """
     try:
-        # Verify user exists and is a creator
-        user = await UserRepository.get_by_id(user_id, columns="id, type, name")
+        # Verify user exists and is a creator (status is needed for the response)
+        user = await UserRepository.get_by_id(user_id, columns="id, type, name, status")
 
         if not user:
             raise HTTPException(
@@ -635,7 +735,8 @@ async def update_creator_profile(
 
         # Get creator profile
         creator = await CreatorRepository.get_by_user_id(
-            user_id, columns="id, profile_complete"
+            user_id,
+            columns="id, location, short_description, portfolio_link, phone, profile_picture, creator_type, created_at, updated_at, profile_complete, user_id"
         )
 
         if not creator:
@@ -646,147 +747,106 @@ async def update_creator_profile(
         
         creator_id = creator['id']
         
-        # Update user name on auth database if provided
-        if request.name is not None:
-            await UserRepository.update_name(user_id, request.name)
-
-        # Start transaction - update creator profile and platforms
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
-            async with conn.transaction():
-                # Build dynamic UPDATE query for creator profile
-                update_fields = []
-                update_values = []
-                param_counter = 1
-                
-                if request.location is not None:
-                    update_fields.append(f"location = ${param_counter}")
-                    update_values.append(request.location)
-                    param_counter += 1
-                
-                if request.shortDescription is not None:
-                    update_fields.append(f"short_description = ${param_counter}")
-                    update_values.append(request.shortDescription)
-                    param_counter += 1
-                
-                if request.portfolioLink is not None:
-                    update_fields.append(f"portfolio_link = ${param_counter}")
-                    update_values.append(str(request.portfolioLink))
-                    param_counter += 1
-                
-                if request.phone is not None:
-                    update_fields.append(f"phone = ${param_counter}")
-                    update_values.append(request.phone)
-                    param_counter += 1
-                
-                if request.profilePicture is not None:
-                    update_fields.append(f"profile_picture = ${param_counter}")
-                    update_values.append(request.profilePicture)
-                    param_counter += 1
-
-                if request.creatorType is not None:
-                    update_fields.append(f"creator_type = ${param_counter}")
-                    update_values.append(request.creatorType)
-                    param_counter += 1
-
-                # Update creator profile if there are fields to update
-                if update_fields:
-                    update_fields.append("updated_at = now()")
-                    update_values.append(creator_id)  # WHERE clause parameter
-                    
-                    update_query = f"""
-                        UPDATE creators 
-                        SET {', '.join(update_fields)}
-                        WHERE id = ${param_counter}
-                    """
-                    await conn.execute(update_query, *update_values)
+        if not request.model_dump(exclude_none=True):
+            # Nothing to write - the verify rows already hold the response
+            creator_data = creator
+            user_data = user
+        else:
+            # Update user name on auth database if provided
+            if request.name is not None:
+                await UserRepository.update_name(user_id, request.name)
+                _users_list_cache.clear()
+
+            # Start transaction - update creator profile and platforms
+            pool = await Database.get_pool()
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    # Update creator profile if there are fields to update
+                    mask = _compute_mask(request, "creators")
+                    if mask:
+                        update_query, attrs, casters = _update_plan(mask, "creators")
+                        await conn.execute(update_query, *_update_values(request, attrs, casters), creator_id)
                 
-                # Update platforms only if provided (replace strategy)
-                if request.platforms is not None:
-                    # Delete existing platforms
-                    await conn.execute(
-                        "DELETE FROM creator_platforms WHERE creator_id = $1",
-                        creator_id
-                    )
+                    # Update platforms only if provided (replace strategy)
+                    if request.platforms is not None:
+                        # Delete existing platforms
+                        await conn.execute(
+                            "DELETE FROM creator_platforms WHERE creator_id = $1",
+                            creator_id
+                        )
                     
-                    # Insert new platforms
-                    for platform in request.platforms:
-                        # Prepare analytics data as JSONB
-                        top_countries_data = None
-                        if platform.topCountries:
-                            # Convert list of dicts to JSON string
-                            top_countries_data = json.dumps([tc if isinstance(tc, dict) else tc.model_dump() for tc in platform.topCountries])
+                        # Insert new platforms in one pipelined batch
+                        platform_rows = []
+                        for platform in request.platforms:
+                            # Prepare analytics data as JSONB
+                            top_countries_data = None
+                            if platform.topCountries:
+                                # Convert list of dicts to JSON string
+                                top_countries_data = json.dumps([tc if isinstance(tc, dict) else tc.model_dump() for tc in platform.topCountries])
                         
-                        top_age_groups_data = None
-                        if platform.topAgeGroups:
-                            top_age_groups_data = json.dumps([tag if isinstance(tag, dict) else tag.model_dump() for tag in platform.topAgeGroups])
+                            top_age_groups_data = None
+                            if platform.topAgeGroups:
+                                top_age_groups_data = json.dumps([tag if isinstance(tag, dict) else tag.model_dump() for tag in platform.topAgeGroups])
                         
-                        gender_split_data = None
-                        if platform.genderSplit:
-                            gender_split_data = json.dumps(platform.genderSplit if isinstance(platform.genderSplit, dict) else platform.genderSplit.model_dump())
+                            gender_split_data = None
+                            if platform.genderSplit:
+                                gender_split_data = json.dumps(platform.genderSplit if isinstance(platform.genderSplit, dict) else platform.genderSplit.model_dump())
                         
-                        await conn.execute(
+                            platform_rows.append((
+                                creator_id,
+                                platform.name,
+                                platform.handle,
+                                platform.followers,
+                                Decimal(str(platform.engagementRate)),
+                                top_countries_data,
+                                top_age_groups_data,
+                                gender_split_data
+                            ))
+
+                        await conn.executemany(
                             """
                             INSERT INTO creator_platforms 
                             (creator_id, name, handle, followers, engagement_rate, top_countries, top_age_groups, gender_split)
                             VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
                             """,
-                            creator_id,
-                            platform.name,
-                            platform.handle,
-                            platform.followers,
-                            Decimal(str(platform.engagementRate)),
-                            top_countries_data,
-                            top_age_groups_data,
-                            gender_split_data
+                            platform_rows
                         )
         
-        # Fetch updated profile with platforms (split across databases)
-        creator_data = await CreatorRepository.get_by_id(
-            creator_id,
-            columns="id, location, short_description, portfolio_link, phone, profile_picture, creator_type, created_at, updated_at, profile_complete, user_id"
-        )
+            # Fetch updated profile with platforms (split across databases)
+            creator_data = await CreatorRepository.get_by_id(
+                creator_id,
+                columns="id, location, short_description, portfolio_link, phone, profile_picture, creator_type, created_at, updated_at, profile_complete, user_id"
+            )
 
-        user_data = await UserRepository.get_by_id(
-            creator_data['user_id'], columns="name, status"
-        )
+            user_data = await UserRepository.get_by_id(
+                creator_data['user_id'], columns="name, status"
+            )
 
-        # Get platforms
-        platforms_data = await CreatorRepository.get_platforms(
-            creator_id,
-            columns="id, name, handle, followers, engagement_rate, top_countries, top_age_groups, gender_split, created_at, updated_at"
-        )
+        # Get platforms (audience total is computed alongside the rows)
+        platforms_data = await CreatorRepository.get_platforms(creator_id, with_audience_total=True)
         
-        platforms = []
-        for p in platforms_data:
-            # Parse JSONB fields
-            def parse_jsonb(value):
-                if value is None:
-                    return None
-                if isinstance(value, str):
-                    return json.loads(value)
-                return value
-            
-            platforms.append(PlatformResponse(
-                id=str(p['id']),
+        # Rows come from our own schema, so skip validation; request.platforms
+        # was already validated on the way in
+        platforms = [
+            PlatformResponse.model_construct(
+                id=p['id'],
                 name=p['name'],
                 handle=p['handle'],
                 followers=p['followers'],
-                engagement_rate=float(p['engagement_rate']),
-                top_countries=parse_jsonb(p['top_countries']),
-                top_age_groups=parse_jsonb(p['top_age_groups']),
-                gender_split=parse_jsonb(p['gender_split']),
-                created_at=p['created_at'],
-                updated_at=p['updated_at']
-            ))
+                engagementRate=float(p['engagement_rate']),
+                topCountries=p['top_countries'],
+                topAgeGroups=p['top_age_groups'],
+                genderSplit=p['gender_split'],
+            )
+            for p in platforms_data
+        ]
         
-        # Calculate audience size
-        audience_size = sum(p['followers'] for p in platforms_data) if platforms_data else 0
+        audience_size = platforms_data[0]['audience_total'] if platforms_data else 0
         
         logger.info(f"Admin {admin_id} updated creator profile for user {user_id}")
         
         return CreatorProfileResponse(
-            id=str(creator_data['id']),
+            id=creator_data['id'],
             name=request.name if request.name is not None else user_data['name'],
             location=creator_data['location'] or "",
             shortDescription=creator_data['short_description'] or "",
@@ -826,8 +886,8 @@ async def update_hotel_profile(
     - Option 2: Provide an existing S3 URL directly in picture field
     """
     try:
-        # Verify user exists and is a hotel
-        user = await UserRepository.get_by_id(user_id, columns="id, type, name")
+        # Verify user exists and is a hotel (email is needed for the response)
+        user = await UserRepository.get_by_id(user_id, columns="id, type, name, email")
 
         if not user:
             raise HTTPException(
@@ -843,7 +903,8 @@ async def update_hotel_profile(
 
         # Get hotel profile
         hotel = await HotelRepository.get_profile_by_user_id(
-            user_id, columns="id, profile_complete"
+            user_id,
+            columns="id, user_id, name, location, about, website, phone, picture, status, created_at, updated_at, profile_complete"
         )
 
         if not hotel:
@@ -854,64 +915,38 @@ async def update_hotel_profile(
         
         hotel_id = hotel['id']
         
-        # Build dynamic UPDATE query for hotel_profiles table
-        update_fields = []
-        update_values = []
-        param_counter = 1
-        
-        if request.name is not None:
-            update_fields.append(f"name = ${param_counter}")
-            update_values.append(request.name)
-            param_counter += 1
-        
-        if request.location is not None:
-            update_fields.append(f"location = ${param_counter}")
-            update_values.append(request.location)
-            param_counter += 1
-        
-        if request.about is not None:
-            update_fields.append(f"about = ${param_counter}")
-            update_values.append(request.about)
-            param_counter += 1
-        
-        if request.website is not None:
-            update_fields.append(f"website = ${param_counter}")
-            update_values.append(str(request.website))
-            param_counter += 1
-        
-        if request.phone is not None:
-            update_fields.append(f"phone = ${param_counter}")
-            update_values.append(request.phone)
-            param_counter += 1
-        
-        if request.picture is not None:
-            update_fields.append(f"picture = ${param_counter}")
-            update_values.append(str(request.picture))
-            param_counter += 1
-        
-        # Update hotel profile if there are fields to update
-        if update_fields:
-            await HotelRepository.update_profile(hotel_id, update_fields, update_values)
+        mask = _compute_mask(request, "hotel_profiles")
 
-        # Update email in users table if provided (auth database)
-        if request.email is not None:
-            await UserRepository.update_email(user_id, request.email)
-        
-        # Fetch updated profile (split across databases)
-        updated_hotel = await HotelRepository.get_profile_by_id(
-            hotel_id,
-            columns="id, user_id, name, location, about, website, phone, picture, status, created_at, updated_at, profile_complete"
-        )
+        if not mask and request.email is None:
+            # Nothing to write - the verify rows already hold the response
+            updated_hotel = hotel
+            updated_user = user
+        else:
+            # Update hotel profile if there are fields to update
+            if mask:
+                update_query, attrs, casters = _update_plan(mask, "hotel_profiles")
+                await Database.execute(update_query, *_update_values(request, attrs, casters), hotel_id)
+
+            # Update email in users table if provided (auth database)
+            if request.email is not None:
+                await UserRepository.update_email(user_id, request.email)
+                _users_list_cache.clear()
+
+            # Fetch updated profile (split across databases)
+            updated_hotel = await HotelRepository.get_profile_by_id(
+                hotel_id,
+                columns="id, user_id, name, location, about, website, phone, picture, status, created_at, updated_at, profile_complete"
+            )
 
-        updated_user = await UserRepository.get_by_id(
-            updated_hotel['user_id'], columns="email, name as user_name"
-        )
+            updated_user = await UserRepository.get_by_id(
+                updated_hotel['user_id'], columns="email, name as user_name"
+            )
 
         logger.info(f"Admin {admin_id} updated hotel profile for user {user_id}")
 
         return HotelProfileResponse(
-            id=str(updated_hotel['id']),
-            user_id=str(updated_hotel['user_id']),
+            id=updated_hotel['id'],
+            user_id=updated_hotel['user_id'],
             name=updated_hotel['name'],
             location=updated_hotel['location'] or "",
             email=updated_user['email'],
@@ -961,92 +996,37 @@ async def update_user(
                     detail="Cannot modify your own status or email verification status"
                 )
         
-        # Verify user exists
-        user = await UserRepository.get_by_id(
-            user_id, columns="id, email, name, type, status, email_verified, avatar"
-        )
-
-        if not user:
-            raise HTTPException(
-                status_code=http_status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
-        
-        # Check if email is being changed and if it's already taken
-        if request.email is not None and request.email != user['email']:
-            existing_user = await AuthDatabase.fetchrow(
-                "SELECT id FROM users WHERE email = $1 AND id != $2",
-                request.email,
-                user_id
-            )
-            
-            if existing_user:
+        mask = _compute_mask(request, "users")
+        if mask:
+            # A single UPDATE ... RETURNING: no row means no such user, and the
+            # unique email constraint reports an email that is already taken
+            update_query, attrs, casters = _update_plan(mask, "users")
+            try:
+                updated_user = await AuthDatabase.fetchrow(
+                    update_query, *_update_values(request, attrs, casters), user_id
+                )
+            except asyncpg.UniqueViolationError:
                 raise HTTPException(
                     status_code=http_status.HTTP_400_BAD_REQUEST,
                     detail="Email already registered"
                 )
-        
-        # Build dynamic UPDATE query
-        update_fields = []
-        update_values = []
-        param_counter = 1
-        
-        if request.name is not None:
-            update_fields.append(f"name = ${param_counter}")
-            update_values.append(request.name)
-            param_counter += 1
-        
-        if request.email is not None:
-            update_fields.append(f"email = ${param_counter}")
-            update_values.append(request.email)
-            param_counter += 1
-        
-        if request.status is not None:
-            update_fields.append(f"status = ${param_counter}")
-            update_values.append(request.status)
-            param_counter += 1
-        
-        if request.emailVerified is not None:
-            update_fields.append(f"email_verified = ${param_counter}")
-            update_values.append(request.emailVerified)
-            param_counter += 1
-        
-        if request.avatar is not None:
-            update_fields.append(f"avatar = ${param_counter}")
-            update_values.append(request.avatar)
-            param_counter += 1
-        
-        # Update user if there are fields to update
-        if update_fields:
-            update_fields.append("updated_at = now()")
-            update_values.append(user_id)  # WHERE clause parameter
-            
-            update_query = f"""
-                UPDATE users 
-                SET {', '.join(update_fields)}
-                WHERE id = ${param_counter}
-            """
-            await AuthDatabase.execute(update_query, *update_values)
+            _users_list_cache.clear()
+        else:
+            # Nothing to write - just return the current user
+            updated_user = await UserRepository.get_by_id(
+                user_id,
+                columns="id, email, name, type, status, email_verified, avatar, created_at, updated_at"
+            )
 
-        # Fetch updated user
-        updated_user = await UserRepository.get_by_id(
-            user_id,
-            columns="id, email, name, type, status, email_verified, avatar, created_at, updated_at"
-        )
+        if not updated_user:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
         
         logger.info(f"Admin {admin_id} updated user {user_id} (fields: {list(request.model_dump(exclude_unset=True).keys())})")
         
-        return UserResponse(
-            id=str(updated_user['id']),
-            email=updated_user['email'],
-            name=updated_user['name'],
-            type=updated_user['type'],
-            status=updated_user['status'],
-            email_verified=updated_user['email_verified'],
-            avatar=updated_user['avatar'],
-            created_at=updated_user['created_at'],
-            updated_at=updated_user['updated_at']
-        )
+        return _AdminJSONResponse(_user_payload(updated_user))
         
     except HTTPException:
         raise
@@ -1060,7 +1040,10 @@ async def update_user(
 
 async def delete_user_images(user_id: str, user_type: str) -> dict:
     """
-    Delete all images associated with a user from S3 by deleting the entire user folder.
+    Delete all images associated with a user from S3 by deleting the user's folders.
+    
+    Hotels own two folders (profile pictures under hotels/, listing images under
+    listings/); they are cleared concurrently, each with batched DeleteObjects calls.
     
     Args:
         user_id: The user's ID
@@ -1071,30 +1054,65 @@ async def delete_user_images(user_id: str, user_type: str) -> dict:
         {
             "deleted_count": int,
             "failed_count": int,
-            "total_objects": int
+            "total_objects": int,
+            "complete": bool
         }
     """
-    # Determine the folder prefix based on user type
+    # Determine the folder prefixes based on user type
     if user_type == 'creator':
-        prefix = f"creators/{user_id}/"
+        prefixes = [f"creators/{user_id}/"]
     elif user_type == 'hotel':
-        prefix = f"listings/{user_id}/"
+        prefixes = [f"hotels/{user_id}/", f"listings/{user_id}/"]
     else:
         logger.warning(f"Unknown user type {user_type}, skipping image deletion")
         return {
             "deleted_count": 0,
             "failed_count": 0,
-            "total_objects": 0
+            "total_objects": 0,
+            "complete": True
         }
     
-    # Delete all objects in the user's folder (includes all images and thumbnails)
-    stats = await delete_all_objects_in_prefix(prefix)
+    # Delete all objects in the user's folders (includes all images and thumbnails)
+    results = await asyncio.gather(*(delete_all_objects_in_prefix(prefix) for prefix in prefixes))
+    stats = {
+        key: sum(result[key] for result in results)
+        for key in ("deleted_count", "failed_count", "total_objects")
+    }
+    stats["complete"] = all(result["complete"] for result in results)
     
-    logger.info(f"Deleted images from S3 folder {prefix} for user {user_id}: {stats['deleted_count']} deleted, {stats['failed_count']} failed, {stats['total_objects']} total")
+    logger.info(f"Deleted images from S3 folders {', '.join(prefixes)} for user {user_id}: {stats['deleted_count']} deleted, {stats['failed_count']} failed, {stats['total_objects']} total")
     
     return stats
 
 
+# Background S3 cleanup retries failures with exponential backoff
+S3_CLEANUP_ATTEMPTS = 3
+S3_CLEANUP_BACKOFF_SECONDS = 0.5
+
+
+async def _delete_s3_keys_job(keys: List[str]) -> None:
+    """Background task: bulk-delete S3 keys, retrying the ones that failed."""
+    for attempt in range(S3_CLEANUP_ATTEMPTS):
+        if attempt:
+            await asyncio.sleep(S3_CLEANUP_BACKOFF_SECONDS * 2 ** (attempt - 1))
+        result = await delete_files_from_s3_batch(keys)
+        keys = result["failed_keys"]
+        if not keys:
+            return
+    logger.error(f"Giving up on deleting {len(keys)} S3 objects after {S3_CLEANUP_ATTEMPTS} attempts: {keys}")
+
+
+async def _delete_user_images_job(user_id: str, user_type: str) -> None:
+    """Background task: clear a deleted user's S3 folders, retrying on failures."""
+    for attempt in range(S3_CLEANUP_ATTEMPTS):
+        if attempt:
+            await asyncio.sleep(S3_CLEANUP_BACKOFF_SECONDS * 2 ** (attempt - 1))
+        stats = await delete_user_images(user_id, user_type)
+        if stats["complete"] and not stats["failed_count"]:
+            return
+    logger.error(f"Giving up on deleting S3 images for user {user_id} after {S3_CLEANUP_ATTEMPTS} attempts ({stats['failed_count']} failed, complete: {stats['complete']})")
+
+
 @router.post("/users/{user_id}/listings", response_model=ListingResponse, status_code=http_status.HTTP_201_CREATED)
 async def create_hotel_listing(
     user_id: str,
@@ -1138,113 +1156,101 @@ async def create_hotel_listing(
 
         hotel_profile_id = hotel_profile['id']
 
-        # Use transaction to ensure atomicity
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
-            async with conn.transaction():
-                # Create listing
-                listing = await conn.fetchrow(
-                    """
-                    INSERT INTO hotel_listings 
-                    (hotel_profile_id, name, location, description, accommodation_type, images)
-                    VALUES ($1, $2, $3, $4, $5, $6)
-                    RETURNING id, name, location, description, accommodation_type, images, 
-                              status, created_at, updated_at
-                    """,
-                    hotel_profile_id,
-                    request.name,
-                    request.location,
-                    request.description,
-                    request.accommodationType,
-                    request.images
-                )
-                
-                listing_id = listing['id']
-                
-                # Create collaboration offerings
-                offerings_response = []
-                for offering in request.collaborationOfferings:
-                    offering_record = await conn.fetchrow(
-                        """
-                        INSERT INTO listing_collaboration_offerings
-                        (listing_id, collaboration_type, availability_months, platforms,
-                         free_stay_min_nights, free_stay_max_nights, paid_max_amount, discount_percentage)
-                        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                        RETURNING id, collaboration_type, availability_months, platforms,
-                                  free_stay_min_nights, free_stay_max_nights, paid_max_amount, 
-                                  discount_percentage, created_at, updated_at
-                        """,
-                        listing_id,
-                        offering.collaborationType,
-                        offering.availabilityMonths,
-                        offering.platforms,
-                        offering.freeStayMinNights,
-                        offering.freeStayMaxNights,
-                        offering.paidMaxAmount,
-                        offering.discountPercentage
-                    )
-                    
-                    offerings_response.append(CollaborationOfferingResponse(
-                        id=str(offering_record['id']),
-                        listing_id=str(listing_id),
-                        collaboration_type=offering_record['collaboration_type'],
-                        availability_months=offering_record['availability_months'],
-                        platforms=offering_record['platforms'],
-                        free_stay_min_nights=offering_record['free_stay_min_nights'],
-                        free_stay_max_nights=offering_record['free_stay_max_nights'],
-                        paid_max_amount=offering_record['paid_max_amount'],
-                        discount_percentage=offering_record['discount_percentage'],
-                        created_at=offering_record['created_at'],
-                        updated_at=offering_record['updated_at']
-                    ))
-                
-                # Create creator requirements
-                requirements = await conn.fetchrow(
-                    """
-                    INSERT INTO listing_creator_requirements
-                    (listing_id, platforms, min_followers, target_countries, target_age_min, target_age_max, target_age_groups)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7)
-                    RETURNING id, platforms, min_followers, target_countries, 
-                              target_age_min, target_age_max, target_age_groups, created_at, updated_at
-                    """,
-                    listing_id,
-                    request.creatorRequirements.platforms,
-                    request.creatorRequirements.minFollowers,
-                    request.creatorRequirements.topCountries,
-                    request.creatorRequirements.targetAgeMin,
-                    request.creatorRequirements.targetAgeMax,
-                    request.creatorRequirements.targetAgeGroups or []
-                )
-                
-                requirements_response = CreatorRequirementsResponse(
-                    id=str(requirements['id']),
-                    listing_id=str(listing_id),
-                    platforms=requirements['platforms'],
-                    min_followers=requirements['min_followers'],
-                    top_countries=requirements['target_countries'],
-                    target_age_min=requirements['target_age_min'],
-                    target_age_max=requirements['target_age_max'],
-                    target_age_groups=requirements['target_age_groups'],
-                    created_at=requirements['created_at'],
-                    updated_at=requirements['updated_at']
+        # Listing, offerings and requirements go in as one statement, which is
+        # atomic on its own. Offerings travel as a JSON array because their
+        # text[] columns cannot be passed as ragged parallel arrays.
+        offerings_json = json.dumps([
+            offering.model_dump(
+                mode="json",
+                by_alias=True,
+                include={
+                    "collaborationType", "availabilityMonths", "platforms", "freeStayMinNights",
+                    "freeStayMaxNights", "paidMaxAmount", "discountPercentage",
+                },
+            )
+            for offering in request.collaborationOfferings
+        ])
+
+        created = await Database.fetchrow(
+            """
+            WITH listing_ins AS (
+                INSERT INTO hotel_listings
+                (hotel_profile_id, name, location, description, accommodation_type, images)
+                VALUES ($1, $2, $3, $4, $5, $6)
+                RETURNING id, name, location, description, accommodation_type, images,
+                          status, created_at, updated_at
+            ),
+            offerings_ins AS (
+                INSERT INTO listing_collaboration_offerings
+                (listing_id, collaboration_type, availability_months, platforms,
+                 free_stay_min_nights, free_stay_max_nights, paid_max_amount, discount_percentage)
+                SELECT listing_ins.id, o.collaboration_type, o.availability_months, o.platforms,
+                       o.free_stay_min_nights, o.free_stay_max_nights, o.paid_max_amount, o.discount_percentage
+                FROM listing_ins, jsonb_to_recordset($7::jsonb) AS o(
+                    collaboration_type text, availability_months text[], platforms text[],
+                    free_stay_min_nights integer, free_stay_max_nights integer,
+                    paid_max_amount numeric, discount_percentage integer
                 )
+                RETURNING id, listing_id, collaboration_type, availability_months, platforms,
+                          free_stay_min_nights, free_stay_max_nights, paid_max_amount,
+                          discount_percentage, created_at, updated_at
+            ),
+            requirements_ins AS (
+                INSERT INTO listing_creator_requirements
+                (listing_id, platforms, min_followers, target_countries, target_age_min, target_age_max, target_age_groups)
+                SELECT id, $8::text[], $9::integer, $10::text[], $11::integer, $12::integer, $13::text[]
+                FROM listing_ins
+                RETURNING id, listing_id, platforms, min_followers, target_countries,
+                          target_age_min, target_age_max, target_age_groups, created_at, updated_at
+            )
+            SELECT
+                listing_ins.*,
+                (SELECT COALESCE(json_agg(offerings_ins), '[]'::json) FROM offerings_ins) AS offerings,
+                (SELECT row_to_json(requirements_ins) FROM requirements_ins) AS requirements
+            FROM listing_ins
+            """,
+            hotel_profile_id,
+            request.name,
+            request.location,
+            request.description,
+            request.accommodationType,
+            request.images,
+            offerings_json,
+            request.creatorRequirements.platforms,
+            request.creatorRequirements.minFollowers,
+            request.creatorRequirements.topCountries,
+            request.creatorRequirements.targetAgeMin,
+            request.creatorRequirements.targetAgeMax,
+            request.creatorRequirements.targetAgeGroups or []
+        )
+
+        offerings_response = [
+            CollaborationOfferingResponse.model_validate(o)
+            for o in created['offerings']
+        ]
+        requirements_response = CreatorRequirementsResponse.model_validate(
+            created['requirements']
+        )
         
         logger.info(f"Admin {admin_id} created listing for hotel user {user_id}")
         
-        return ListingResponse(
-            id=str(listing_id),
-            hotel_profile_id=str(hotel_profile_id),
-            name=listing['name'],
-            location=listing['location'],
-            description=listing['description'],
-            accommodation_type=listing['accommodation_type'],
-            images=listing['images'],
-            status=listing['status'],
-            created_at=listing['created_at'],
-            updated_at=listing['updated_at'],
+        # The nested models were validated just above (their JSON rows carry
+        # timestamps as strings); the listing fields come back as typed
+        # columns of the row itself, so they need no validation
+        return _model_response(ListingResponse.model_construct(
+            id=created['id'],
+            hotel_profile_id=hotel_profile_id,
+            name=created['name'],
+            location=created['location'],
+            description=created['description'],
+            accommodation_type=created['accommodation_type'],
+            images=created['images'],
+            status=created['status'],
+            created_at=created['created_at'],
+            updated_at=created['updated_at'],
             collaboration_offerings=offerings_response,
             creator_requirements=requirements_response
-        )
+        ), status_code=http_status.HTTP_201_CREATED)
         
     except HTTPException:
         raise
@@ -1273,13 +1279,20 @@ async def _get_listing_with_details_admin(listing_id: str, hotel_profile_id: str
             detail="Listing not found"
         )
 
-    # Get collaboration offerings
+    # Get collaboration offerings and creator requirements
     offerings_data = await HotelRepository.get_offerings(listing_id)
+    requirements = await HotelRepository.get_requirements(listing_id)
     
+    return _format_listing_details(listing, offerings_data, requirements)
+
+
+def _format_listing_details(listing: dict, offerings_data: list, requirements: Optional[dict]) -> dict:
+    """Shape listing, offering and requirement rows the way the admin listing endpoints return them"""
+    # Rows come straight from our own schema, so skip validation
     offerings_response = [
-        CollaborationOfferingResponse.model_validate({
-            "id": str(o['id']),
-            "listing_id": str(o['listing_id']),
+        CollaborationOfferingResponse.model_construct(**{
+            "id": o['id'],
+            "listing_id": o['listing_id'],
             "collaboration_type": o['collaboration_type'],
             "availability_months": o['availability_months'],
             "platforms": o['platforms'],
@@ -1293,20 +1306,18 @@ async def _get_listing_with_details_admin(listing_id: str, hotel_profile_id: str
         for o in offerings_data
     ]
     
-    # Get creator requirements
-    requirements = await HotelRepository.get_requirements(listing_id)
-    
     requirements_response = None
     if requirements:
-        requirements_response = CreatorRequirementsResponse.model_validate({
-            "id": str(requirements['id']),
-            "listing_id": str(listing['id']),
+        requirements_response = CreatorRequirementsResponse.model_construct(**{
+            "id": requirements['id'],
+            "listing_id": listing['id'],
             "platforms": requirements['platforms'],
             "min_followers": requirements['min_followers'],
-            "top_countries": requirements['target_countries'],
+            "target_countries": requirements['target_countries'],
             "target_age_min": requirements['target_age_min'],
             "target_age_max": requirements['target_age_max'],
             "target_age_groups": requirements['target_age_groups'],
+            "creator_types": requirements['creator_types'],
             "created_at": requirements['created_at'],
             "updated_at": requirements['updated_at']
         })
@@ -1318,6 +1329,94 @@ async def _get_listing_with_details_admin(listing_id: str, hotel_profile_id: str
     }
 
 
+async def _sync_listing_offerings(
+    conn,
+    listing_id: str,
+    offerings: List[CollaborationOfferingRequest]
+) -> list:
+    """
+    Make a listing's stored offerings match ``offerings``.
+    
+    Incoming offerings are paired with existing rows of the same collaboration
+    type: identical rows are left untouched, changed ones are updated in place,
+    leftovers are deleted and unpaired offerings are inserted. A type that
+    appears more than once is paired in order, first with first.
+    
+    Returns the listing's offering rows after the sync.
+    """
+    existing = await HotelRepository.get_offerings(listing_id, conn=conn)
+    
+    unmatched_by_type = {}
+    for row in existing:
+        if row['collaboration_type'] not in unmatched_by_type:
+            unmatched_by_type[row['collaboration_type']] = []
+        unmatched_by_type[row['collaboration_type']].append(row)
+    
+    updates = []
+    inserts = []
+    for offering in offerings:
+        values = (
+            offering.availabilityMonths,
+            offering.platforms,
+            offering.freeStayMinNights,
+            offering.freeStayMaxNights,
+            offering.paidMaxAmount,
+            offering.discountPercentage
+        )
+        candidates = unmatched_by_type.get(offering.collaborationType)
+        if candidates:
+            row = candidates.pop(0)
+            stored = (
+                row['availability_months'],
+                row['platforms'],
+                row['free_stay_min_nights'],
+                row['free_stay_max_nights'],
+                row['paid_max_amount'],
+                row['discount_percentage']
+            )
+            if stored != values:
+                updates.append((row['id'], *values))
+        else:
+            inserts.append((listing_id, offering.collaborationType, *values))
+    
+    removed_ids = [row['id'] for rows in unmatched_by_type.values() for row in rows]
+    
+    if not (removed_ids or updates or inserts):
+        return existing
+    
+    if removed_ids:
+        await conn.execute(
+            "DELETE FROM listing_collaboration_offerings WHERE id = ANY($1::uuid[])",
+            removed_ids
+        )
+    
+    if updates:
+        await conn.executemany(
+            """
+            UPDATE listing_collaboration_offerings
+            SET availability_months = $2, platforms = $3,
+                free_stay_min_nights = $4, free_stay_max_nights = $5,
+                paid_max_amount = $6, discount_percentage = $7,
+                updated_at = now()
+            WHERE id = $1
+            """,
+            updates
+        )
+    
+    if inserts:
+        await conn.executemany(
+            """
+            INSERT INTO listing_collaboration_offerings
+            (listing_id, collaboration_type, availability_months, platforms,
+             free_stay_min_nights, free_stay_max_nights, paid_max_amount, discount_percentage)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+            """,
+            inserts
+        )
+    
+    return await HotelRepository.get_offerings(listing_id, conn=conn)
+
+
 @router.put("/users/{user_id}/listings/{listing_id}", response_model=ListingResponse, status_code=http_status.HTTP_200_OK)
 async def update_hotel_listing(
     user_id: str,
@@ -1361,118 +1460,80 @@ async def update_hotel_listing(
 
         hotel_profile_id = hotel_profile['id']
 
-        # Get current listing data
-        listing_data = await _get_listing_with_details_admin(listing_id, hotel_profile_id)
-        current_listing = listing_data["listing"]
-
-        # Use transaction to ensure atomicity
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
-            async with conn.transaction():
-                # Build dynamic UPDATE query for listing
-                update_fields = []
-                update_values = []
-                param_counter = 1
-                
-                if request.name is not None:
-                    update_fields.append(f"name = ${param_counter}")
-                    update_values.append(request.name)
-                    param_counter += 1
-                
-                if request.location is not None:
-                    update_fields.append(f"location = ${param_counter}")
-                    update_values.append(request.location)
-                    param_counter += 1
-                
-                if request.description is not None:
-                    update_fields.append(f"description = ${param_counter}")
-                    update_values.append(request.description)
-                    param_counter += 1
-                
-                if request.accommodationType is not None:
-                    update_fields.append(f"accommodation_type = ${param_counter}")
-                    update_values.append(request.accommodationType)
-                    param_counter += 1
-                
-                if request.images is not None:
-                    update_fields.append(f"images = ${param_counter}")
-                    update_values.append(request.images)
-                    param_counter += 1
+        if not request.model_dump(exclude_none=True):
+            # Nothing to change - just read the listing back; this 404s on
+            # its own when the listing does not belong to this hotel
+            updated_data = await _get_listing_with_details_admin(listing_id, hotel_profile_id)
+        else:
+            # Use transaction to ensure atomicity; every write returns its rows,
+            # so the response is built without reading the listing back
+            pool = await Database.get_pool()
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    # Verify listing exists and belongs to hotel
+                    listing = await HotelRepository.get_listing(listing_id, hotel_profile_id, conn=conn)
+                    if not listing:
+                        raise HTTPException(
+                            status_code=http_status.HTTP_404_NOT_FOUND,
+                            detail="Listing not found"
+                        )
+
+                    # Update listing if there are fields to update
+                    mask = _compute_mask(request, "hotel_listings")
+                    if mask:
+                        update_query, attrs, casters = _update_plan(mask, "hotel_listings")
+                        listing = dict(await conn.fetchrow(
+                            update_query, *_update_values(request, attrs, casters), listing_id
+                        ))
                 
-                # Update listing if there are fields to update
-                if update_fields:
-                    update_fields.append("updated_at = now()")
-                    update_values.append(listing_id)  # WHERE clause parameter
-                    
-                    update_query = f"""
-                        UPDATE hotel_listings 
-                        SET {', '.join(update_fields)}
-                        WHERE id = ${param_counter}
-                    """
-                    await conn.execute(update_query, *update_values)
+                    # Update collaboration offerings if provided (replace semantics,
+                    # applied as a diff against the stored rows)
+                    if request.collaborationOfferings is not None:
+                        offerings_data = await _sync_listing_offerings(conn, listing_id, request.collaborationOfferings)
+                    else:
+                        offerings_data = await HotelRepository.get_offerings(listing_id, conn=conn)
                 
-                # Update collaboration offerings if provided (replace strategy)
-                if request.collaborationOfferings is not None:
-                    # Delete existing offerings
-                    await conn.execute(
-                        "DELETE FROM listing_collaboration_offerings WHERE listing_id = $1",
-                        listing_id
-                    )
-                    
-                    # Insert new offerings
-                    for offering in request.collaborationOfferings:
+                    # Update creator requirements if provided
+                    if request.creatorRequirements is not None:
+                        # Delete existing requirements
                         await conn.execute(
+                            "DELETE FROM listing_creator_requirements WHERE listing_id = $1",
+                            listing_id
+                        )
+                    
+                        # Insert new requirements
+                        requirements = dict(await conn.fetchrow(
                             """
-                            INSERT INTO listing_collaboration_offerings
-                            (listing_id, collaboration_type, availability_months, platforms,
-                             free_stay_min_nights, free_stay_max_nights, paid_max_amount, discount_percentage)
-                            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                            INSERT INTO listing_creator_requirements
+                            (listing_id, platforms, min_followers, target_countries, target_age_min, target_age_max, target_age_groups)
+                            VALUES ($1, $2, $3, $4, $5, $6, $7)
+                            RETURNING id, listing_id, platforms, min_followers, target_countries,
+                                      target_age_min, target_age_max, target_age_groups, creator_types, created_at, updated_at
                             """,
                             listing_id,
-                            offering.collaborationType,
-                            offering.availabilityMonths,
-                            offering.platforms,
-                            offering.freeStayMinNights,
-                            offering.freeStayMaxNights,
-                            offering.paidMaxAmount,
-                            offering.discountPercentage
-                        )
-                
-                # Update creator requirements if provided
-                if request.creatorRequirements is not None:
-                    # Delete existing requirements
-                    await conn.execute(
-                        "DELETE FROM listing_creator_requirements WHERE listing_id = $1",
-                        listing_id
-                    )
-                    
-                    # Insert new requirements
-                    await conn.execute(
-                        """
-                        INSERT INTO listing_creator_requirements
-                        (listing_id, platforms, min_followers, target_countries, target_age_min, target_age_max, target_age_groups)
-                        VALUES ($1, $2, $3, $4, $5, $6, $7)
-                        """,
-                        listing_id,
-                        request.creatorRequirements.platforms,
-                        request.creatorRequirements.minFollowers,
-                        request.creatorRequirements.topCountries,
-                        request.creatorRequirements.targetAgeMin,
-                        request.creatorRequirements.targetAgeMax,
-                        request.creatorRequirements.targetAgeGroups or []
-                    )
-        
-        # Fetch updated listing with details
-        updated_data = await _get_listing_with_details_admin(listing_id, hotel_profile_id)
+                            request.creatorRequirements.platforms,
+                            request.creatorRequirements.minFollowers,
+                            request.creatorRequirements.topCountries,
+                            request.creatorRequirements.targetAgeMin,
+                            request.creatorRequirements.targetAgeMax,
+                            request.creatorRequirements.targetAgeGroups or []
+                        ))
+                    else:
+                        requirements = await HotelRepository.get_requirements(listing_id, conn=conn)
+
+            updated_data = _format_listing_details(listing, offerings_data, requirements)
+
         updated_listing = updated_data["listing"]
         updated_offerings = updated_data["offerings"]
         updated_requirements = updated_data["requirements"]
         
         logger.info(f"Admin {admin_id} updated listing {listing_id} for hotel user {user_id}")
         
-        return ListingResponse.model_validate({
-            "id": str(updated_listing['id']),
-            "hotel_profile_id": str(updated_listing['hotel_profile_id']),
+        # Every value comes straight from the database or from models built
+        # above, so skip re-validating them
+        return _model_response(ListingResponse.model_construct(**{
+            "id": updated_listing['id'],
+            "hotel_profile_id": updated_listing['hotel_profile_id'],
             "name": updated_listing['name'],
             "location": updated_listing['location'],
             "description": updated_listing['description'],
@@ -1483,7 +1544,7 @@ async def update_hotel_listing(
             "updated_at": updated_listing['updated_at'],
             "collaboration_offerings": updated_offerings,
             "creator_requirements": updated_requirements
-        })
+        }))
         
     except HTTPException:
         raise
@@ -1505,6 +1566,7 @@ async def update_hotel_listing(
 async def delete_hotel_listing(
     user_id: str,
     listing_id: str,
+    background_tasks: BackgroundTasks,
     admin_id: str = Depends(get_admin_user)
 ):
     """
@@ -1514,14 +1576,20 @@ async def delete_hotel_listing(
     - Listing record
     - All collaboration offerings for this listing
     - All creator requirements for this listing
-    - All listing images from S3 (including thumbnails)
+    - All listing images from S3 (including thumbnails), in the background
+      after the response is sent
     
     **Warning**: This action cannot be undone!
     """
     try:
-        # Verify user exists and is a hotel
-        user = await UserRepository.get_by_id(user_id, columns="id, type")
+        # The user lives in the auth DB and the profile in the business DB,
+        # so the two lookups can't be joined; run them concurrently instead
+        user, hotel_profile = await asyncio.gather(
+            UserRepository.get_by_id(user_id, columns="id, type"),
+            HotelRepository.get_profile_by_user_id(user_id, columns="id")
+        )
 
+        # Verify user exists and is a hotel
         if not user:
             raise HTTPException(
                 status_code=http_status.HTTP_404_NOT_FOUND,
@@ -1534,11 +1602,6 @@ async def delete_hotel_listing(
                 detail="User is not a hotel"
             )
 
-        # Get hotel profile
-        hotel_profile = await HotelRepository.get_profile_by_user_id(
-            user_id, columns="id"
-        )
-
         if not hotel_profile:
             raise HTTPException(
                 status_code=http_status.HTTP_404_NOT_FOUND,
@@ -1558,53 +1621,29 @@ async def delete_hotel_listing(
                 detail="Listing not found"
             )
 
-        # Delete listing images from S3
-        deleted_images = 0
-        failed_images = 0
-        if listing['images']:
-            for image_url in listing['images']:
-                if image_url:
-                    # Extract S3 key from URL
-                    s3_key = extract_key_from_url(image_url)
-                    if s3_key:
-                        # Delete main image
-                        if await delete_file_from_s3(s3_key):
-                            deleted_images += 1
-                        else:
-                            failed_images += 1
-                        
-                        # Delete thumbnail if it exists (thumbnail key is the same but with _thumb before extension)
-                        # e.g., listings/user_id/file.jpg -> listings/user_id/file_thumb.jpg
-                        if '.' in s3_key:
-                            parts = s3_key.rsplit('.', 1)
-                            thumbnail_key = f"{parts[0]}_thumb.{parts[1]}"
-                            if await delete_file_from_s3(thumbnail_key):
-                                deleted_images += 1
-                            # Don't count thumbnail failures as critical
-        
-        # Use transaction to ensure atomicity
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
-            async with conn.transaction():
-                # Delete collaboration offerings (cascade should handle this, but being explicit)
-                await conn.execute(
-                    "DELETE FROM listing_collaboration_offerings WHERE listing_id = $1",
-                    listing_id
-                )
-                
-                # Delete creator requirements (cascade should handle this, but being explicit)
-                await conn.execute(
-                    "DELETE FROM listing_creator_requirements WHERE listing_id = $1",
-                    listing_id
-                )
-                
-                # Delete the listing itself
-                await conn.execute(
-                    "DELETE FROM hotel_listings WHERE id = $1",
-                    listing_id
-                )
-        
-        logger.info(f"Admin {admin_id} deleted listing {listing_id} for hotel user {user_id} (deleted {deleted_images} images, {failed_images} failed)")
+        # Collect listing image keys (and their thumbnails) for one bulk S3 delete
+        image_keys = []
+        for image_url in listing['images'] or []:
+            if image_url:
+                # Extract S3 key from URL
+                s3_key = extract_key_from_url(image_url)
+                if s3_key:
+                    image_keys.append(s3_key)
+                    # Thumbnail key is the same but with _thumb before extension
+                    # e.g., listings/user_id/file.jpg -> listings/user_id/file_thumb.jpg
+                    if '.' in s3_key:
+                        parts = s3_key.rsplit('.', 1)
+                        image_keys.append(f"{parts[0]}_thumb.{parts[1]}")
+        
+        # Offerings, requirements and collaborations go with it via ON DELETE CASCADE;
+        # a single statement is atomic without an explicit transaction
+        await Database.execute("DELETE FROM hotel_listings WHERE id = $1", listing_id)
+        
+        # S3 cleanup runs after the response has been sent
+        if image_keys:
+            background_tasks.add_task(_delete_s3_keys_job, image_keys)
+        
+        logger.info(f"Admin {admin_id} deleted listing {listing_id} for hotel user {user_id} ({len(image_keys)} images queued for deletion)")
         
         return {
             "message": "Listing deleted successfully",
@@ -1612,8 +1651,7 @@ async def delete_hotel_listing(
                 "id": listing_id,
                 "name": listing['name']
             },
-            "images_deleted": deleted_images,
-            "images_failed": failed_images
+            "images_queued": len(image_keys)
         }
         
     except HTTPException:
@@ -1629,6 +1667,7 @@ async def delete_hotel_listing(
 @router.delete("/users/{user_id}", status_code=http_status.HTTP_200_OK)
 async def delete_user(
     user_id: str,
+    background_tasks: BackgroundTasks,
     admin_id: str = Depends(get_admin_user)
 ):
     """
@@ -1638,7 +1677,8 @@ async def delete_user(
     - User account
     - Creator profile (if creator) - including all platforms
     - Hotel profile (if hotel) - including all listings, offerings, and requirements
-    - All associated S3 images (profile pictures, listing images, and their thumbnails)
+    - All associated S3 images (profile pictures, listing images, and their thumbnails),
+      in the background after the response is sent
     - All related records (cascade delete)
     
     **Warning**: This action cannot be undone!
@@ -1662,28 +1702,21 @@ async def delete_user(
                 detail="User not found"
             )
 
-        # Delete all images associated with this user from S3
-        image_deletion_stats = await delete_user_images(user_id, user['type'])
-
-        # Delete business data first (different DB, no cross-DB cascade)
+        # Delete business data first (different DB, no cross-DB cascade).
+        # Platforms cascade from the creator; listings cascade from the hotel
+        # profile, and offerings/requirements from the listings, so a single
+        # statement removes everything and needs no explicit transaction
         if user['type'] == 'creator':
-            creator = await CreatorRepository.get_by_user_id(user_id, columns="id")
-            if creator:
-                await CreatorRepository.delete_platforms(creator['id'])
-                await Database.execute("DELETE FROM creators WHERE id = $1", creator['id'])
+            await Database.execute("DELETE FROM creators WHERE user_id = $1", user_id)
         elif user['type'] == 'hotel':
-            hotel = await HotelRepository.get_profile_by_user_id(user_id, columns="id")
-            if hotel:
-                # Delete listings and their children
-                listings = await HotelRepository.get_listings_by_profile_id(hotel['id'], columns="id")
-                for listing in listings:
-                    await HotelRepository.delete_offerings(listing['id'])
-                    await HotelRepository.delete_requirements(listing['id'])
-                await Database.execute("DELETE FROM hotel_listings WHERE hotel_profile_id = $1", hotel['id'])
-                await Database.execute("DELETE FROM hotel_profiles WHERE id = $1", hotel['id'])
+            await Database.execute("DELETE FROM hotel_profiles WHERE user_id = $1", user_id)
 
         # Delete user from auth DB
         await UserRepository.delete(user_id)
+        _users_list_cache.clear()
+
+        # Delete all images associated with this user from S3 after the response is sent
+        background_tasks.add_task(_delete_user_images_job, user_id, user['type'])
         
         logger.info(f"Admin {admin_id} deleted user {user_id} (type: {user['type']}, email: {user['email']})")
         
@@ -1707,6 +1740,57 @@ async def delete_user(
         )
 
 
+@functools.cache
+def _collaborations_list_queries(has_status: bool, has_search: bool, has_user_ids: bool) -> Tuple[str, str]:
+    """Return the (page, count) queries for the admin collaborations filter combination.
+
+    Filter values are bound in order (status, search pattern, matching creator
+    user ids); the page query then takes LIMIT and OFFSET. ``has_user_ids``
+    only applies with ``has_search``: the search also matches creators whose
+    auth-DB name matched.
+    """
+    conditions = []
+    if has_status:
+        conditions.append(f"c.status = ${len(conditions) + 1}")
+    if has_search:
+        index = len(conditions) + 1
+        if has_user_ids:
+            # Search by hotel name OR by user name (pre-fetched IDs)
+            conditions.append(f"(hp.name ILIKE ${index} OR cr.user_id = ANY(${index + 1}::uuid[]))")
+        else:
+            conditions.append(f"hp.name ILIKE ${index}")
+    param_count = len(conditions) + (1 if has_search and has_user_ids else 0)
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    # Data query (no JOIN users, add cr.user_id); the total is computed over
+    # the filtered set in the same pass
+    data_query = f"""
+        SELECT c.*,
+               cr.profile_picture as creator_profile_picture,
+               cr.user_id as creator_user_id,
+               hp.name as hotel_name,
+               hl.name as listing_name,
+               hl.location as listing_location,
+               COUNT(*) OVER () as total_count
+        FROM collaborations c
+        JOIN creators cr ON cr.id = c.creator_id
+        JOIN hotel_profiles hp ON hp.id = c.hotel_id
+        JOIN hotel_listings hl ON hl.id = c.listing_id
+        {where}
+        ORDER BY c.created_at DESC
+        LIMIT ${param_count + 1} OFFSET ${param_count + 2}
+    """
+    count_query = f"""
+        SELECT COUNT(*) as total
+        FROM collaborations c
+        JOIN creators cr ON cr.id = c.creator_id
+        JOIN hotel_profiles hp ON hp.id = c.hotel_id
+        {where}
+    """
+    return data_query, count_query
+
+
 @router.get("/collaborations", response_model=CollaborationListResponse, status_code=http_status.HTTP_200_OK)
 async def get_admin_collaborations(
     page: int = Query(1, ge=1, description="Page number"),
@@ -1728,92 +1812,55 @@ async def get_admin_collaborations(
             )
             search_user_ids = [r['id'] for r in search_users]
 
-        # Build WHERE clause for business data
-        where_conditions = []
+        # Filter values are bound in the order the query builder expects
         params = []
-        param_counter = 1
-
         if status:
-            where_conditions.append(f"c.status = ${param_counter}")
             params.append(status)
-            param_counter += 1
-
         if search:
-            # Search by hotel name OR by user name (pre-fetched IDs)
+            params.append(f"%{search}%")
             if search_user_ids:
-                where_conditions.append(f"(hp.name ILIKE ${param_counter} OR cr.user_id = ANY(${param_counter + 1}::uuid[]))")
-                params.append(f"%{search}%")
                 params.append(search_user_ids)
-                param_counter += 2
-            else:
-                where_conditions.append(f"hp.name ILIKE ${param_counter}")
-                params.append(f"%{search}%")
-                param_counter += 1
-
-        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-
-        # Count query (no JOIN users)
-        count_query = f"""
-            SELECT COUNT(*) as total
-            FROM collaborations c
-            JOIN creators cr ON cr.id = c.creator_id
-            JOIN hotel_profiles hp ON hp.id = c.hotel_id
-            WHERE {where_clause}
-        """
-        total_result = await Database.fetchrow(count_query, *params)
-        total = total_result['total'] if total_result else 0
-
-        # Data query (no JOIN users, add cr.user_id)
+
+        data_query, count_query = _collaborations_list_queries(
+            bool(status), bool(search), bool(search_user_ids)
+        )
+
         offset = (page - 1) * page_size
-        limit_param = param_counter
-        offset_param = param_counter + 1
-
-        data_query = f"""
-            SELECT c.*,
-                   cr.profile_picture as creator_profile_picture,
-                   cr.user_id as creator_user_id,
-                   hp.name as hotel_name,
-                   hl.name as listing_name,
-                   hl.location as listing_location
-            FROM collaborations c
-            JOIN creators cr ON cr.id = c.creator_id
-            JOIN hotel_profiles hp ON hp.id = c.hotel_id
-            JOIN hotel_listings hl ON hl.id = c.listing_id
-            WHERE {where_clause}
-            ORDER BY c.created_at DESC
-            LIMIT ${limit_param} OFFSET ${offset_param}
-        """
-
-        query_params = params + [page_size, offset]
-        rows = await Database.fetch(data_query, *query_params)
-
-        # Batch-fetch user names from AuthDatabase
+        rows = await Database.fetch(data_query, *params, page_size, offset)
+
         if rows:
-            creator_user_ids = list(set(row['creator_user_id'] for row in rows))
-            user_rows = await AuthDatabase.fetch(
-                "SELECT id, name FROM users WHERE id = ANY($1::uuid[])",
-                creator_user_ids
-            )
-            users_map = {str(u['id']): u['name'] for u in user_rows}
+            total = rows[0]['total_count']
+        elif offset:
+            # Page past the end returns no rows to carry the window count
+            total = await Database.fetchval(count_query, *params)
         else:
-            users_map = {}
+            total = 0
+
+        # Batch-fetch creator names (auth DB) and deliverables (business DB)
+        # for the whole page; the two databases are queried concurrently
+        creator_user_ids = list(set(row['creator_user_id'] for row in rows))
+        users_map, deliverables_map = await asyncio.gather(
+            UserRepository.batch_get_names(creator_user_ids),
+            get_collaboration_deliverables_bulk([row['id'] for row in rows])
+        )
 
+        # Rows are already typed by asyncpg, so the responses are built with
+        # model_construct rather than validated field by field
         collaborations = []
         for row in rows:
-            # Fetch deliverables for each collaboration
-            collab_id = str(row['id'])
-            deliverables = await get_collaboration_deliverables(collab_id)
+            collab_id = row['id']
+            deliverables = deliverables_map.get(collab_id, [])
 
-            collaborations.append(CollaborationResponse(
+            collaborations.append(CollaborationResponse.model_construct(
                 id=collab_id,
                 initiator_type=row['initiator_type'],
                 status=row['status'],
-                creator_id=str(row['creator_id']),
-                creator_name=users_map.get(str(row['creator_user_id']), 'Unknown'),
+                creator_id=row['creator_id'],
+                creator_name=users_map.get(row['creator_user_id'], 'Unknown'),
                 creator_profile_picture=row['creator_profile_picture'],
-                hotel_id=str(row['hotel_id']),
+                hotel_id=row['hotel_id'],
                 hotel_name=row['hotel_name'],
-                listing_id=str(row['listing_id']),
+                listing_id=row['listing_id'],
                 listing_name=row['listing_name'],
                 listing_location=row['listing_location'],
                 collaboration_type=row['collaboration_type'],
@@ -1840,7 +1887,7 @@ async def get_admin_collaborations(
                 term_last_updated_at=row['term_last_updated_at']
             ))
 
-        return CollaborationListResponse(collaborations=collaborations, total=total)
+        return _model_response(CollaborationListResponse.model_construct(collaborations=collaborations, total=total))
         
     except Exception as e:
         logger.error(f"Error fetching admin collaborations: {str(e)}", exc_info=True)
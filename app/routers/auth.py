@@ -4,6 +4,7 @@ Authentication routes
 from fastapi import APIRouter, HTTPException, status, Depends, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
+import asyncio
 import bcrypt
 import logging
 
@@ -167,11 +168,12 @@ async def register(request: RegisterRequest):
                 detail="Email already registered"
             )
 
-        # Hash password
-        password_hash = bcrypt.hashpw(
+        # Hash password in a worker thread so bcrypt doesn't stall the event loop
+        password_hash = (await asyncio.to_thread(
+            bcrypt.hashpw,
             request.password.encode('utf-8'),
             bcrypt.gensalt()
-        ).decode('utf-8')
+        )).decode('utf-8')
 
         # Use provided name or default to email prefix
         user_name = request.name
@@ -261,8 +263,9 @@ async def login(request: LoginRequest):
                 detail="Invalid email or password"
             )
 
-        # Verify password
-        password_valid = bcrypt.checkpw(
+        # Verify password in a worker thread so bcrypt doesn't stall the event loop
+        password_valid = await asyncio.to_thread(
+            bcrypt.checkpw,
             request.password.encode('utf-8'),
             user['password_hash'].encode('utf-8')
         )
@@ -481,8 +484,8 @@ async def reset_password(request: ResetPasswordRequest):
 
         user_id = token_data['user_id']
 
-        # Hash the new password
-        password_hash = hash_password(request.new_password)
+        # Hash the new password in a worker thread
+        password_hash = await asyncio.to_thread(hash_password, request.new_password)
 
         # Update user's password
         await UserRepository.update_password(user_id, password_hash)
@@ -95,7 +95,7 @@ async def get_chat_messages(
             sender_id=str(m['sender_id']) if m['sender_id'] else None,
             content=m['content'],
             message_type=m['message_type'],
-            metadata=json.loads(m['metadata']) if m['metadata'] else None,
+            metadata=m['metadata'],
             created_at=m['created_at'],
             read_at=m['read_at'],
             sender_name=sender_names_map.get(str(m['sender_id']), 'System') if m['sender_id'] else 'System',
@@ -2,7 +2,7 @@
 Collaboration routes for creators and hotels
 """
 from fastapi import APIRouter, HTTPException, status, Depends, Query
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from app.database import Database
 from app.dependencies import get_current_user_id, get_current_hotel_profile_id
@@ -113,6 +113,43 @@ async def get_collaboration_deliverables(collaboration_id: str) -> List[Platform
     ]
 
 
+async def get_collaboration_deliverables_bulk(collaboration_ids: List[str]) -> Dict[str, List[PlatformDeliverablesItem]]:
+    """
+    Fetch deliverables for several collaborations in one query, keyed by
+    collaboration id and grouped the same way as get_collaboration_deliverables.
+    """
+    rows = await CollaborationRepository.get_deliverables_batch(collaboration_ids)
+    # Keep the per-collaboration ordering of get_deliverables
+    rows.sort(key=lambda row: (row['platform'], row['type']))
+
+    # Group by collaboration, then by platform
+    collab_platform_map = {}
+    for row in rows:
+        collab_id = str(row['collaboration_id'])
+        if collab_id not in collab_platform_map:
+            collab_platform_map[collab_id] = {}
+
+        platform_map = collab_platform_map[collab_id]
+        platform = row['platform']
+        if platform not in platform_map:
+            platform_map[platform] = []
+
+        platform_map[platform].append(PlatformDeliverable(
+            id=str(row['id']),
+            type=row['type'],
+            quantity=row['quantity'],
+            status=row['status']
+        ))
+
+    return {
+        collab_id: [
+            PlatformDeliverablesItem(platform=platform, deliverables=deliverables)
+            for platform, deliverables in platform_map.items()
+        ]
+        for collab_id, platform_map in collab_platform_map.items()
+    }
+
+
 # ============================================
 # ENDPOINTS
 # ============================================
@@ -177,9 +177,9 @@ async def get_creator_profile(user_id: str = Depends(get_current_user_id_allow_p
                 handle=p['handle'],
                 followers=p['followers'],
                 engagement_rate=float(p['engagement_rate']),
-                topCountries=json.loads(p['top_countries']) if p['top_countries'] else None,
-                topAgeGroups=json.loads(p['top_age_groups']) if p['top_age_groups'] else None,
-                genderSplit=json.loads(p['gender_split']) if p['gender_split'] else None
+                topCountries=p['top_countries'],
+                topAgeGroups=p['top_age_groups'],
+                genderSplit=p['gender_split']
             ) for p in platforms_data
         ]
         
@@ -345,19 +345,15 @@ async def update_creator_profile(
                         creator_id
                     )
                     
-                    # Insert new platforms
+                    # Insert new platforms in one pipelined batch
+                    platform_rows = []
                     for platform in request.platforms:
                         # Prepare analytics data as JSONB (serialize to string for DB)
                         top_countries_data = json.dumps([tc.model_dump() for tc in platform.topCountries]) if platform.topCountries else None
                         top_age_groups_data = json.dumps([tag.model_dump() for tag in platform.topAgeGroups]) if platform.topAgeGroups else None
                         gender_split_data = json.dumps(platform.genderSplit.model_dump()) if platform.genderSplit else None
                         
-                        await conn.execute(
-                            """
-                            INSERT INTO creator_platforms
-                            (creator_id, name, handle, followers, engagement_rate, top_countries, top_age_groups, gender_split)
-                            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                            """,
+                        platform_rows.append((
                             creator_id,
                             platform.name,
                             platform.handle,
@@ -366,6 +362,16 @@ async def update_creator_profile(
                             top_countries_data,
                             top_age_groups_data,
                             gender_split_data
+                        ))
+                    
+                    if platform_rows:
+                        await conn.executemany(
+                            """
+                            INSERT INTO creator_platforms
+                            (creator_id, name, handle, followers, engagement_rate, top_countries, top_age_groups, gender_split)
+                            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                            """,
+                            platform_rows
                         )
 
         # Delete old profile picture from S3 if replaced with a new one
@@ -441,9 +447,9 @@ async def update_creator_profile(
                 handle=p['handle'],
                 followers=p['followers'],
                 engagement_rate=float(p['engagement_rate']),
-                top_countries=json.loads(p['top_countries']) if p['top_countries'] else None,
-                top_age_groups=json.loads(p['top_age_groups']) if p['top_age_groups'] else None,
-                gender_split=json.loads(p['gender_split']) if p['gender_split'] else None
+                top_countries=p['top_countries'],
+                top_age_groups=p['top_age_groups'],
+                gender_split=p['gender_split']
             ))
         
         return CreatorProfileResponse(
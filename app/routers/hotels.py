@@ -2,7 +2,7 @@
 Hotel profile routes
 """
 from fastapi import APIRouter, HTTPException, status as http_status, Depends, UploadFile, File, Form, Request, Query
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import EmailStr
 from datetime import datetime
 import logging
@@ -181,67 +181,7 @@ async def get_hotel_profile(user_id: str = Depends(get_current_user_id_allow_pen
                 detail="Hotel profile not found"
             )
 
-        listings_data = await HotelRepository.get_listings_by_profile_id(hotel["id"])
-
-        listings_response: List[dict] = []
-        for listing in listings_data:
-            offerings_data = await HotelRepository.get_offerings(listing["id"])
-            offerings_response = [
-                CollaborationOfferingResponse.model_validate(
-                    {
-                        "id": str(o["id"]),
-                        "listing_id": str(o["listing_id"]),
-                        "collaboration_type": o["collaboration_type"],
-                        "availability_months": o["availability_months"],
-                        "platforms": o["platforms"],
-                        "free_stay_min_nights": o["free_stay_min_nights"],
-                        "free_stay_max_nights": o["free_stay_max_nights"],
-                        "paid_max_amount": o["paid_max_amount"],
-                        "discount_percentage": o["discount_percentage"],
-                        "created_at": o["created_at"],
-                        "updated_at": o["updated_at"],
-                    }
-                ).model_dump(by_alias=True)
-                for o in offerings_data
-            ]
-
-            requirements = await HotelRepository.get_requirements(listing["id"])
-            requirements_response = None
-            if requirements:
-                requirements_response = CreatorRequirementsResponse.model_validate(
-                    {
-                        "id": str(requirements["id"]),
-                        "listing_id": str(listing["id"]),
-                        "platforms": requirements["platforms"],
-                        "min_followers": requirements["min_followers"],
-                        "target_countries": requirements["target_countries"],
-                        "target_age_min": requirements["target_age_min"],
-                        "target_age_max": requirements["target_age_max"],
-                        "target_age_groups": requirements["target_age_groups"],
-                        "creator_types": requirements["creator_types"],
-                        "created_at": requirements["created_at"],
-                        "updated_at": requirements["updated_at"],
-                    }
-                ).model_dump(by_alias=True)
-
-            listings_response.append(
-                ListingResponse.model_validate(
-                    {
-                        "id": str(listing["id"]),
-                        "hotel_profile_id": str(listing["hotel_profile_id"]),
-                        "name": listing["name"],
-                        "location": listing["location"],
-                        "description": listing["description"],
-                        "accommodation_type": listing["accommodation_type"],
-                        "images": listing["images"] or [],
-                        "status": listing["status"],
-                        "created_at": listing["created_at"],
-                        "updated_at": listing["updated_at"],
-                        "collaboration_offerings": offerings_response,
-                        "creator_requirements": requirements_response,
-                    }
-                ).model_dump(by_alias=True)
-            )
+        listings_response = await _get_listings_with_details(hotel["id"])
 
         return HotelProfileResponse(
             id=str(hotel["id"]),
@@ -537,65 +477,7 @@ async def update_hotel_profile(
                 logger.error(f"Error sending profile completion email: {str(e)}")
         
         # Get all listings for this hotel (same as GET endpoint)
-        listings_data = await HotelRepository.get_listings_by_profile_id(hotel['id'])
-
-        listings_response = []
-        for listing in listings_data:
-            # Get collaboration offerings for this listing
-            offerings_data = await HotelRepository.get_offerings(listing['id'])
-
-            offerings_response = [
-                CollaborationOfferingResponse.model_validate({
-                    "id": str(o['id']),
-                    "listing_id": str(o['listing_id']),
-                    "collaboration_type": o['collaboration_type'],
-                    "availability_months": o['availability_months'],
-                    "platforms": o['platforms'],
-                    "free_stay_min_nights": o['free_stay_min_nights'],
-                    "free_stay_max_nights": o['free_stay_max_nights'],
-                    "paid_max_amount": o['paid_max_amount'],
-                    "discount_percentage": o['discount_percentage'],
-                    "created_at": o['created_at'],
-                    "updated_at": o['updated_at'],
-                }).model_dump(by_alias=True)
-                for o in offerings_data
-            ]
-
-            # Get creator requirements for this listing
-            requirements = await HotelRepository.get_requirements(listing['id'])
-
-            requirements_response = None
-            if requirements:
-                requirements_response = CreatorRequirementsResponse.model_validate({
-                    "id": str(requirements['id']),
-                    "listing_id": str(listing['id']),
-                    "platforms": requirements['platforms'],
-                    "min_followers": requirements['min_followers'],
-                    "target_countries": requirements['target_countries'],
-                    "target_age_min": requirements['target_age_min'],
-                    "target_age_max": requirements['target_age_max'],
-                    "target_age_groups": requirements['target_age_groups'],
-                    "creator_types": requirements['creator_types'],
-                    "created_at": requirements['created_at'],
-                    "updated_at": requirements['updated_at'],
-                }).model_dump(by_alias=True)
-            
-            listings_response.append(
-                ListingResponse.model_validate({
-                    "id": str(listing['id']),
-                    "hotel_profile_id": str(listing['hotel_profile_id']),
-                    "name": listing['name'],
-                    "location": listing['location'],
-                    "description": listing['description'],
-                    "accommodation_type": listing['accommodation_type'],
-                    "images": listing['images'] or [],
-                    "status": listing['status'],
-                    "created_at": listing['created_at'],
-                    "updated_at": listing['updated_at'],
-                    "collaboration_offerings": offerings_response,
-                    "creator_requirements": requirements_response,
-                }).model_dump(by_alias=True)
-            )
+        listings_response = await _get_listings_with_details(hotel['id'])
         
         return HotelProfileResponse(
             id=str(updated_hotel['id']),
@@ -762,6 +644,76 @@ async def create_hotel_listing(
         )
 
 
+async def _get_listings_with_details(hotel_profile_id: str) -> List[dict]:
+    """Helper function to fetch all of a hotel's listings with their offerings and requirements.
+
+    Listings come joined with their (1:1) requirements and the offerings of
+    every listing are fetched in one batch, so this is two queries regardless
+    of how many listings the hotel has.
+    """
+    listings_data = await HotelRepository.get_listings_with_requirements_by_profile_id(hotel_profile_id)
+
+    all_offerings = await HotelRepository.get_offerings_for_listings([l['id'] for l in listings_data])
+    offerings_by_listing: Dict[str, List[dict]] = {}
+    for o in all_offerings:
+        offerings_by_listing.setdefault(str(o['listing_id']), []).append(o)
+
+    listings_response: List[dict] = []
+    for listing in listings_data:
+        listing_id = str(listing['id'])
+        offerings_response = [
+            CollaborationOfferingResponse.model_validate({
+                "id": str(o['id']),
+                "listing_id": str(o['listing_id']),
+                "collaboration_type": o['collaboration_type'],
+                "availability_months": o['availability_months'],
+                "platforms": o['platforms'],
+                "free_stay_min_nights": o['free_stay_min_nights'],
+                "free_stay_max_nights": o['free_stay_max_nights'],
+                "paid_max_amount": o['paid_max_amount'],
+                "discount_percentage": o['discount_percentage'],
+                "created_at": o['created_at'],
+                "updated_at": o['updated_at'],
+            }).model_dump(by_alias=True)
+            for o in offerings_by_listing.get(listing_id, [])
+        ]
+
+        requirements_response = None
+        if listing['req_id'] is not None:
+            requirements_response = CreatorRequirementsResponse.model_validate({
+                "id": str(listing['req_id']),
+                "listing_id": listing_id,
+                "platforms": listing['req_platforms'],
+                "min_followers": listing['req_min_followers'],
+                "target_countries": listing['req_target_countries'],
+                "target_age_min": listing['req_target_age_min'],
+                "target_age_max": listing['req_target_age_max'],
+                "target_age_groups": listing['req_target_age_groups'],
+                "creator_types": listing['req_creator_types'],
+                "created_at": listing['req_created_at'],
+                "updated_at": listing['req_updated_at'],
+            }).model_dump(by_alias=True)
+
+        listings_response.append(
+            ListingResponse.model_validate({
+                "id": listing_id,
+                "hotel_profile_id": str(listing['hotel_profile_id']),
+                "name": listing['name'],
+                "location": listing['location'],
+                "description": listing['description'],
+                "accommodation_type": listing['accommodation_type'],
+                "images": listing['images'] or [],
+                "status": listing['status'],
+                "created_at": listing['created_at'],
+                "updated_at": listing['updated_at'],
+                "collaboration_offerings": offerings_response,
+                "creator_requirements": requirements_response,
+            }).model_dump(by_alias=True)
+        )
+
+    return listings_response
+
+
 async def _get_listing_with_details(listing_id: str, hotel_profile_id: str) -> dict:
     """Helper function to fetch a listing with its offerings and requirements"""
     # Verify listing belongs to hotel
@@ -1007,27 +959,9 @@ async def delete_hotel_listing(
                 detail="Listing not found"
             )
         
-        # Use transaction to ensure atomicity
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
-            async with conn.transaction():
-                # Delete collaboration offerings (cascade should handle this, but being explicit)
-                await conn.execute(
-                    "DELETE FROM listing_collaboration_offerings WHERE listing_id = $1",
-                    listing_id
-                )
-                
-                # Delete creator requirements (cascade should handle this, but being explicit)
-                await conn.execute(
-                    "DELETE FROM listing_creator_requirements WHERE listing_id = $1",
-                    listing_id
-                )
-                
-                # Delete the listing itself
-                await conn.execute(
-                    "DELETE FROM hotel_listings WHERE id = $1",
-                    listing_id
-                )
+        # Offerings and requirements go with it via ON DELETE CASCADE;
+        # a single statement is atomic without an explicit transaction
+        await Database.execute("DELETE FROM hotel_listings WHERE id = $1", listing_id)
         
         return None
         
@@ -1224,9 +1158,9 @@ async def get_hotel_collaboration_detail(
                 handle=p['handle'],
                 followers=p['followers'],
                 engagement_rate=float(p['engagement_rate']),
-                top_countries=json.loads(p['top_countries']) if p['top_countries'] else None,
-                top_age_groups=json.loads(p['top_age_groups']) if p['top_age_groups'] else None,
-                gender_split=json.loads(p['gender_split']) if p['gender_split'] else None
+                top_countries=p['top_countries'],
+                top_age_groups=p['top_age_groups'],
+                gender_split=p['gender_split']
             ))
             
         # Fetch reputation data
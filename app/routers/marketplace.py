@@ -5,7 +5,6 @@ from fastapi import APIRouter, HTTPException, status, Query
 from typing import List, Optional, Literal
 from datetime import datetime
 import logging
-import json
 
 from app.models.common import CollaborationOfferingResponse, CreatorRequirementsResponse
 from app.models.marketplace import (
@@ -166,26 +165,18 @@ async def get_all_creators(
             if creator_id_str not in platforms_map:
                 platforms_map[creator_id_str] = []
             
-            # Parse JSON data and convert dict to list format if needed
-            top_countries = None
-            if p['top_countries']:
-                parsed = json.loads(p['top_countries'])
-                # Convert dict to list format: [{"country": "USA", "percentage": 45}, ...]
-                if isinstance(parsed, dict):
-                    top_countries = [{"country": k, "percentage": v} for k, v in parsed.items()]
-                else:
-                    top_countries = parsed
+            # JSON data arrives parsed; convert dict to list format if needed
+            top_countries = p['top_countries']
+            # Convert dict to list format: [{"country": "USA", "percentage": 45}, ...]
+            if isinstance(top_countries, dict):
+                top_countries = [{"country": k, "percentage": v} for k, v in top_countries.items()]
             
-            top_age_groups = None
-            if p['top_age_groups']:
-                parsed = json.loads(p['top_age_groups'])
-                # Convert dict to list format: [{"ageRange": "25-34", "percentage": 40}, ...]
-                if isinstance(parsed, dict):
-                    top_age_groups = [{"ageRange": k, "percentage": v} for k, v in parsed.items()]
-                else:
-                    top_age_groups = parsed
+            top_age_groups = p['top_age_groups']
+            # Convert dict to list format: [{"ageRange": "25-34", "percentage": 40}, ...]
+            if isinstance(top_age_groups, dict):
+                top_age_groups = [{"ageRange": k, "percentage": v} for k, v in top_age_groups.items()]
             
-            gender_split = json.loads(p['gender_split']) if p['gender_split'] else None
+            gender_split = p['gender_split']
             
             platforms_map[creator_id_str].append(PlatformMarketplaceResponse(
                 id=str(p['id']),
@@ -1,6 +1,7 @@
 """
 AWS S3 service for file uploads and URL generation
 """
+import asyncio
 import boto3
 import logging
 from typing import Optional
@@ -112,7 +113,9 @@ async def delete_file_from_s3(file_key: str) -> bool:
     """
     try:
         s3_client = get_s3_client()
-        s3_client.delete_object(
+        # boto3 is blocking; run in a worker thread so concurrent deletes overlap
+        await asyncio.to_thread(
+            s3_client.delete_object,
             Bucket=settings.S3_BUCKET_NAME,
             Key=file_key
         )
@@ -154,77 +157,176 @@ async def list_objects_in_prefix(prefix: str) -> list[str]:
         return []
 
 
-async def delete_all_objects_in_prefix(prefix: str) -> dict:
+# S3 accepts at most 1000 keys per DeleteObjects request
+S3_DELETE_BATCH_SIZE = 1000
+# Upper bound on DeleteObjects requests in flight for a single bulk delete
+S3_DELETE_CONCURRENCY = 8
+
+
+async def _delete_object_batch(s3_client, keys: list[str], semaphore: asyncio.Semaphore) -> list[str]:
     """
-    Delete all objects in an S3 prefix (folder)
+    Delete one batch of keys with a single DeleteObjects request
+    
+    Returns:
+        Keys that could not be deleted
+    """
+    async with semaphore:
+        try:
+            # boto3 is blocking, so the request runs in a worker thread
+            response = await asyncio.to_thread(
+                s3_client.delete_objects,
+                Bucket=settings.S3_BUCKET_NAME,
+                Delete={
+                    'Objects': [{'Key': key} for key in keys],
+                    'Quiet': True
+                }
+            )
+        except ClientError as e:
+            logger.error(f"Error deleting batch from S3: {e}")
+            return list(keys)
+    
+    # Quiet mode only reports failures, everything else was deleted
+    errors = response.get('Errors', [])
+    if errors:
+        # One record per batch; the per-key details travel as structured fields
+        logger.warning(
+            f"Failed to delete {len(errors)} of {len(keys)} objects from S3",
+            extra={
+                "s3_delete_errors": [
+                    {
+                        "key": error['Key'],
+                        "code": error.get('Code'),
+                        "message": error.get('Message', 'Unknown error')
+                    }
+                    for error in errors
+                ]
+            }
+        )
+    
+    return [error['Key'] for error in errors]
+
+
+async def delete_files_from_s3_batch(file_keys: list[str]) -> dict:
+    """
+    Delete multiple files from S3 with DeleteObjects requests
+    
+    Keys are sent in chunks of S3_DELETE_BATCH_SIZE, with at most
+    S3_DELETE_CONCURRENCY requests in flight.
     
     Args:
-        prefix: S3 prefix (folder path), e.g., "creators/user_id/" or "listings/user_id/"
+        file_keys: S3 object keys (paths in bucket)
     
     Returns:
         Dictionary with deletion statistics:
         {
             "deleted_count": int,
             "failed_count": int,
-            "total_objects": int
+            "failed_keys": list[str]
         }
     """
-    object_keys = await list_objects_in_prefix(prefix)
-    
-    if not object_keys:
+    if not file_keys:
         return {
             "deleted_count": 0,
             "failed_count": 0,
-            "total_objects": 0
+            "failed_keys": []
         }
     
+    try:
+        s3_client = get_s3_client()
+        semaphore = asyncio.Semaphore(S3_DELETE_CONCURRENCY)
+        results = await asyncio.gather(*(
+            _delete_object_batch(s3_client, file_keys[i:i + S3_DELETE_BATCH_SIZE], semaphore)
+            for i in range(0, len(file_keys), S3_DELETE_BATCH_SIZE)
+        ))
+        failed_keys = [key for batch_failed in results for key in batch_failed]
+    except Exception as e:
+        logger.error(f"Unexpected error deleting files from S3: {e}")
+        failed_keys = list(file_keys)
+    
+    return {
+        "deleted_count": len(file_keys) - len(failed_keys),
+        "failed_count": len(failed_keys),
+        "failed_keys": failed_keys
+    }
+
+
+async def delete_all_objects_in_prefix(prefix: str) -> dict:
+    """
+    Delete all objects in an S3 prefix (folder)
+    
+    Listing and deletion are pipelined: each page of keys is handed to a
+    DeleteObjects request while the next page is being listed, with at most
+    S3_DELETE_CONCURRENCY delete requests in flight.
+    
+    Args:
+        prefix: S3 prefix (folder path), e.g., "creators/user_id/" or "listings/user_id/"
+    
+    Returns:
+        Dictionary with deletion statistics:
+        {
+            "deleted_count": int,
+            "failed_count": int,
+            "total_objects": int,
+            "complete": bool  # False if the prefix could not be fully listed,
+                              # so objects beyond total_objects may remain
+        }
+    """
     deleted_count = 0
     failed_count = 0
+    total_objects = 0
+    complete = False
+    tasks = []
+    
+    async def delete_batch(s3_client, keys: list[str], semaphore: asyncio.Semaphore):
+        nonlocal deleted_count, failed_count
+        batch_failed = await _delete_object_batch(s3_client, keys, semaphore)
+        failed_count += len(batch_failed)
+        deleted_count += len(keys) - len(batch_failed)
     
     try:
         s3_client = get_s3_client()
+        semaphore = asyncio.Semaphore(S3_DELETE_CONCURRENCY)
         
-        # Delete objects in batches (S3 allows up to 1000 objects per delete request)
-        batch_size = 1000
-        for i in range(0, len(object_keys), batch_size):
-            batch = object_keys[i:i + batch_size]
-            
-            # Prepare delete request
-            delete_objects = [{'Key': key} for key in batch]
-            
-            try:
-                response = s3_client.delete_objects(
-                    Bucket=settings.S3_BUCKET_NAME,
-                    Delete={
-                        'Objects': delete_objects,
-                        'Quiet': True
-                    }
-                )
-                
-                # Count successful deletions
-                if 'Deleted' in response:
-                    deleted_count += len(response['Deleted'])
-                
-                # Count errors
-                if 'Errors' in response:
-                    failed_count += len(response['Errors'])
-                    for error in response['Errors']:
-                        logger.warning(f"Failed to delete {error['Key']}: {error.get('Message', 'Unknown error')}")
+        paginator = s3_client.get_paginator('list_objects_v2')
+        pages = iter(paginator.paginate(
+            Bucket=settings.S3_BUCKET_NAME,
+            Prefix=prefix,
+            PaginationConfig={'PageSize': S3_DELETE_BATCH_SIZE}
+        ))
+        
+        try:
+            while True:
+                page = await asyncio.to_thread(next, pages, None)
+                if page is None:
+                    complete = True
+                    break
                 
-            except ClientError as e:
-                logger.error(f"Error deleting batch from S3: {e}")
-                failed_count += len(batch)
+                keys = [obj['Key'] for obj in page.get('Contents', [])]
+                if keys:
+                    total_objects += len(keys)
+                    tasks.append(asyncio.create_task(delete_batch(s3_client, keys, semaphore)))
+        except ClientError as e:
+            # Batches already listed are still deleted below; the caller sees
+            # complete=False and has to retry for whatever was never listed
+            logger.error(f"Error listing objects in S3 prefix {prefix}: {e}")
+        
+        await asyncio.gather(*tasks)
         
-        logger.info(f"Deleted {deleted_count} objects from S3 prefix {prefix} (failed: {failed_count}, total: {len(object_keys)})")
+        if total_objects:
+            logger.info(f"Deleted {deleted_count} objects from S3 prefix {prefix} (failed: {failed_count}, total: {total_objects})")
         
     except Exception as e:
         logger.error(f"Unexpected error deleting objects from S3 prefix {prefix}: {e}")
-        failed_count = len(object_keys)
+        for task in tasks:
+            task.cancel()
+        # Batches that finished keep their counts; the rest were not deleted
+        failed_count = total_objects - deleted_count
     
     return {
         "deleted_count": deleted_count,
         "failed_count": failed_count,
-        "total_objects": len(object_keys)
+        "total_objects": total_objects,
+        "complete": complete
     }
 
 
@@ -0,0 +1,17 @@
+-- ============================================
+-- Trigram index for hotel name search
+-- ============================================
+-- The admin collaborations search filters with hp.name ILIKE '%term%',
+-- which a btree index cannot serve. A pg_trgm GIN index lets the planner
+-- answer substring matches without a sequential scan of hotel_profiles.
+--
+-- The matching index on users.name belongs to the shared auth database,
+-- which is not managed by these migrations.
+--
+-- Migrations run inside a transaction, so the index is built without
+-- CONCURRENTLY; hotel_profiles is small enough for the brief lock.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_hotel_profiles_name_trgm
+    ON public.hotel_profiles USING gin (name gin_trgm_ops);
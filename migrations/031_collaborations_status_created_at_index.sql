@@ -0,0 +1,12 @@
+-- ============================================
+-- Composite index for the admin collaborations list
+-- ============================================
+-- The admin list filters on status and pages by created_at DESC. With this
+-- index Postgres can walk the matching status range already in order and
+-- stop at LIMIT, instead of sorting every row with that status.
+--
+-- The unfiltered list is already served by idx_collaborations_created_at
+-- (migration 018).
+
+CREATE INDEX IF NOT EXISTS idx_collaborations_status_created_at
+    ON public.collaborations(status, created_at DESC);
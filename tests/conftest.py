@@ -195,23 +195,28 @@ def mock_s3_operations():
         deleted_files.append(file_key)
         return True
 
+    async def mock_delete_batch(file_keys: list):
+        deleted_files.extend(file_keys)
+        return {"deleted_count": len(file_keys), "failed_count": 0, "failed_keys": []}
+
     async def mock_list_prefix(prefix: str):
         listed_files.append(prefix)
         return []  # Return empty list - no files to delete
 
     async def mock_delete_prefix(prefix: str):
         deleted_files.append(f"prefix:{prefix}")
-        return {"deleted_count": 0, "failed_count": 0, "total_objects": 0}
+        return {"deleted_count": 0, "failed_count": 0, "total_objects": 0, "complete": True}
 
     # Patch at both source module AND where functions are imported in routers
     # This is necessary because `from module import func` binds func locally
     with patch("app.s3_service.upload_file_to_s3", side_effect=mock_upload), \
          patch("app.s3_service.delete_file_from_s3", side_effect=mock_delete), \
+         patch("app.s3_service.delete_files_from_s3_batch", side_effect=mock_delete_batch), \
          patch("app.s3_service.list_objects_in_prefix", side_effect=mock_list_prefix), \
          patch("app.s3_service.delete_all_objects_in_prefix", side_effect=mock_delete_prefix), \
          patch("app.routers.upload.upload_file_to_s3", side_effect=mock_upload), \
          patch("app.routers.hotels.upload_file_to_s3", side_effect=mock_upload), \
-         patch("app.routers.admin.delete_file_from_s3", side_effect=mock_delete), \
+         patch("app.routers.admin.delete_files_from_s3_batch", side_effect=mock_delete_batch), \
          patch("app.routers.admin.delete_all_objects_in_prefix", side_effect=mock_delete_prefix):
         yield {"uploaded": uploaded_files, "deleted": deleted_files, "listed": listed_files}
 
@@ -1,15 +1,21 @@
 """
 Tests for admin management endpoints.
 """
+import asyncpg
+import base64
+import uuid
 import pytest
+from datetime import datetime
 from httpx import AsyncClient
 
+from app.config import settings
 from app.database import Database, AuthDatabase
 from tests.conftest import (
     get_auth_headers,
     create_test_creator,
     create_test_hotel,
     create_test_admin,
+    create_test_user,
     create_test_listing,
     create_test_platform,
     create_test_collaboration,
@@ -119,6 +125,273 @@ class TestGetUsers:
         assert response.status_code == 403
 
 
+class TestGetUsersCursor:
+    """Tests for keyset pagination of GET /admin/users (cursor / next_cursor)"""
+
+    async def _walk_pages(self, client: AsyncClient, admin_token: str, params: dict) -> list:
+        """Follow next_cursor from the first page to the end; returns every page's body."""
+        pages = []
+        cursor = None
+        while True:
+            query = dict(params, **({"cursor": cursor} if cursor else {}))
+            response = await client.get(
+                "/admin/users", params=query, headers=get_auth_headers(admin_token)
+            )
+            assert response.status_code == 200
+            pages.append(response.json())
+            cursor = pages[-1]["next_cursor"]
+            if cursor is None:
+                return pages
+            assert len(pages) < 20, "cursor pagination did not terminate"
+
+    async def test_cursor_pages_across_equal_created_at(
+        self, client: AsyncClient, test_admin, cleanup_database, init_database
+    ):
+        """Test users sharing a created_at are neither skipped nor repeated."""
+        tag = uuid.uuid4().hex[:8]
+        users = [await create_test_user(name=f"Cursor {tag} {i}") for i in range(5)]
+        await AuthDatabase.execute(
+            "UPDATE users SET created_at = '2024-01-01T00:00:00Z' WHERE id = ANY($1::uuid[])",
+            [u["id"] for u in users]
+        )
+
+        pages = await self._walk_pages(
+            client, test_admin["token"], {"search": f"Cursor {tag}", "page_size": 2}
+        )
+
+        seen = [u["id"] for page in pages for u in page["users"]]
+        assert len(seen) == len(set(seen)) == 5
+        assert set(seen) == {str(u["id"]) for u in users}
+        # Ties on created_at are broken by id, descending
+        assert seen == sorted(seen, reverse=True)
+
+    async def test_cursor_with_search_and_type_filters(
+        self, client: AsyncClient, test_admin, cleanup_database, init_database
+    ):
+        """Test cursor pages stay inside the search and type filters."""
+        tag = uuid.uuid4().hex[:8]
+        creators = [await create_test_creator(name=f"Filter {tag} C{i}") for i in range(3)]
+        for i in range(2):
+            await create_test_hotel(name=f"Filter {tag} H{i}")
+        await create_test_creator(name=f"Other {tag}")
+
+        pages = await self._walk_pages(
+            client, test_admin["token"],
+            {"search": f"Filter {tag}", "type": "creator", "page_size": 2}
+        )
+
+        users = [u for page in pages for u in page["users"]]
+        assert {u["id"] for u in users} == {str(c["user"]["id"]) for c in creators}
+        assert all(u["type"] == "creator" for u in users)
+
+    async def test_total_stable_across_cursor_pages(
+        self, client: AsyncClient, test_admin, cleanup_database, init_database
+    ):
+        """Test every page reports the filter's total, not the page's remainder."""
+        tag = uuid.uuid4().hex[:8]
+        for i in range(5):
+            await create_test_user(name=f"Total {tag} {i}")
+
+        pages = await self._walk_pages(
+            client, test_admin["token"], {"search": f"Total {tag}", "page_size": 2}
+        )
+
+        assert [len(page["users"]) for page in pages] == [2, 2, 1]
+        assert [page["total"] for page in pages] == [5, 5, 5]
+
+    @pytest.mark.parametrize("cursor", [
+        "not-a-cursor",
+        base64.urlsafe_b64encode(b"[1, 2, 3]").decode(),
+        base64.urlsafe_b64encode(b'["2024-01-01T00:00:00+00:00", "not-a-uuid"]').decode(),
+        base64.urlsafe_b64encode(b'["yesterday", "00000000-0000-0000-0000-000000000000"]').decode(),
+        base64.urlsafe_b64encode(b'["2024-01-01T00:00:00+00:00", 5]').decode(),
+        base64.urlsafe_b64encode(b'[20240101, "00000000-0000-0000-0000-000000000000"]').decode(),
+    ])
+    async def test_malformed_cursor(
+        self, client: AsyncClient, test_admin, cursor
+    ):
+        """Test a cursor that does not decode is rejected with 400."""
+        response = await client.get(
+            "/admin/users",
+            params={"cursor": cursor},
+            headers=get_auth_headers(test_admin["token"])
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+
+class TestGetUsersCacheInvalidation:
+    """Tests that admin writes to users are reflected in the cached GET /admin/users pages"""
+
+    async def _list(self, client: AsyncClient, admin_token: str, search: str) -> dict:
+        response = await client.get(
+            "/admin/users",
+            params={"search": search},
+            headers=get_auth_headers(admin_token)
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    async def test_list_reflects_update(
+        self, client: AsyncClient, test_admin, cleanup_database, init_database
+    ):
+        """Test updating a user shows up on the next identical list request."""
+        tag = uuid.uuid4().hex[:8]
+        user = await create_test_user(name=f"Cache {tag} Before")
+
+        before = await self._list(client, test_admin["token"], f"Cache {tag}")
+        assert [u["name"] for u in before["users"]] == [f"Cache {tag} Before"]
+
+        response = await client.put(
+            f"/admin/users/{user['id']}",
+            json={"name": f"Cache {tag} After"},
+            headers=get_auth_headers(test_admin["token"])
+        )
+        assert response.status_code == 200
+
+        after = await self._list(client, test_admin["token"], f"Cache {tag}")
+        assert [u["name"] for u in after["users"]] == [f"Cache {tag} After"]
+
+    async def test_list_reflects_creator_profile_name_update(
+        self, client: AsyncClient, test_admin, cleanup_database, init_database
+    ):
+        """Test renaming a user via the creator profile endpoint shows up in the list."""
+        tag = uuid.uuid4().hex[:8]
+        creator = await create_test_creator(name=f"Cache {tag} Before")
+
+        before = await self._list(client, test_admin["token"], f"Cache {tag}")
+        assert [u["name"] for u in before["users"]] == [f"Cache {tag} Before"]
+
+        response = await client.put(
+            f"/admin/users/{creator['user']['id']}/profile/creator",
+            json={"name": f"Cache {tag} After"},
+            headers=get_auth_headers(test_admin["token"])
+        )
+        assert response.status_code == 200
+
+        after = await self._list(client, test_admin["token"], f"Cache {tag}")
+        assert [u["name"] for u in after["users"]] == [f"Cache {tag} After"]
+
+    async def test_list_reflects_hotel_profile_email_update(
+        self, client: AsyncClient, test_admin, cleanup_database, init_database
+    ):
+        """Test changing a user's email via the hotel profile endpoint shows up in the list."""
+        tag = uuid.uuid4().hex[:8]
+        hotel = await create_test_hotel(name=f"Cache {tag} Hotel")
+        new_email = generate_test_email("cache_hotel")
+
+        before = await self._list(client, test_admin["token"], f"Cache {tag}")
+        assert [u["email"] for u in before["users"]] == [hotel["user"]["email"]]
+
+        response = await client.put(
+            f"/admin/users/{hotel['user']['id']}/profile/hotel",
+            json={"email": new_email},
+            headers=get_auth_headers(test_admin["token"])
+        )
+        assert response.status_code == 200
+
+        after = await self._list(client, test_admin["token"], f"Cache {tag}")
+        assert [u["email"] for u in after["users"]] == [new_email]
+
+    async def test_list_reflects_create(
+        self, client: AsyncClient, test_admin, cleanup_database, init_database
+    ):
+        """Test creating a user shows up on the next identical list request."""
+        tag = uuid.uuid4().hex[:8]
+
+        before = await self._list(client, test_admin["token"], f"Cache {tag}")
+        assert before["total"] == 0
+
+        response = await client.post(
+            "/admin/users",
+            json={
+                "email": generate_test_email("cache"),
+                "password": "SecurePassword123!",
+                "name": f"Cache {tag} New",
+                "type": "creator",
+                "status": "verified"
+            },
+            headers=get_auth_headers(test_admin["token"])
+        )
+        assert response.status_code == 201
+
+        after = await self._list(client, test_admin["token"], f"Cache {tag}")
+        assert after["total"] == 1
+        assert after["users"][0]["name"] == f"Cache {tag} New"
+
+    async def test_list_reflects_delete(
+        self, client: AsyncClient, test_admin, cleanup_database, init_database
+    ):
+        """Test deleting a user shows up on the next identical list request."""
+        tag = uuid.uuid4().hex[:8]
+        creator = await create_test_creator(name=f"Cache {tag} Gone")
+
+        before = await self._list(client, test_admin["token"], f"Cache {tag}")
+        assert before["total"] == 1
+
+        response = await client.delete(
+            f"/admin/users/{creator['user']['id']}",
+            headers=get_auth_headers(test_admin["token"])
+        )
+        assert response.status_code == 200
+
+        after = await self._list(client, test_admin["token"], f"Cache {tag}")
+        assert after["total"] == 0
+        assert after["users"] == []
+
+
+class TestAuthReadReplica:
+    """Tests for admin user reads served by a read-only auth DB replica"""
+
+    @pytest.fixture
+    async def read_only_replica(self, monkeypatch, init_database):
+        """Point AUTH_DATABASE_REPLICA_URL at the auth DB with every transaction read-only."""
+        monkeypatch.setattr(
+            settings, "AUTH_DATABASE_REPLICA_URL",
+            f"{settings.AUTH_DATABASE_URL}?default_transaction_read_only=on"
+        )
+        # A write registered for the primary pool must not be run on replica connections
+        monkeypatch.setattr(
+            AuthDatabase, "_warm_statements",
+            AuthDatabase._warm_statements + [("UPDATE users SET updated_at = now() WHERE id = $1", 1)]
+        )
+        monkeypatch.setattr(AuthDatabase, "_read_pool", None)
+        yield
+        if AuthDatabase._read_pool is not None:
+            await AuthDatabase._read_pool.close()
+
+    async def test_replica_pool_opens_read_only(self, read_only_replica):
+        """Test replica connections open, decode UUIDs as str and refuse writes."""
+        pool = await AuthDatabase.get_read_pool()
+        assert pool is not await AuthDatabase.get_pool()
+
+        async with pool.acquire() as conn:
+            assert await conn.fetchval("SHOW default_transaction_read_only") == "on"
+            assert isinstance(await conn.fetchval("SELECT gen_random_uuid()"), str)
+            with pytest.raises(asyncpg.ReadOnlySQLTransactionError):
+                await conn.execute("UPDATE users SET updated_at = now() WHERE id = NULL")
+
+    async def test_admin_user_reads_use_replica(
+        self, client: AsyncClient, test_admin, test_creator, read_only_replica
+    ):
+        """Test the users list and user details work against a read-only replica."""
+        headers = get_auth_headers(test_admin["token"])
+
+        response = await client.get(
+            "/admin/users",
+            params={"search": test_creator["user"]["email"]},
+            headers=headers
+        )
+        assert response.status_code == 200
+        assert [u["id"] for u in response.json()["users"]] == [str(test_creator["user"]["id"])]
+
+        response = await client.get(f"/admin/users/{test_creator['user']['id']}", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["email"] == test_creator["user"]["email"]
+        assert AuthDatabase._read_pool is not None
+
+
 class TestGetUserDetails:
     """Tests for GET /admin/users/{user_id}"""
 
@@ -158,6 +431,89 @@ class TestGetUserDetails:
         assert "profile" in data
         assert "listings" in data["profile"]
 
+    async def test_get_creator_details_platform_shape(
+        self, client: AsyncClient, test_admin, test_creator_verified
+    ):
+        """Test the nested platforms keep their keys and the profile its "Z" timestamps."""
+        user_id = str(test_creator_verified["user"]["id"])
+
+        response = await client.get(
+            f"/admin/users/{user_id}",
+            headers=get_auth_headers(test_admin["token"])
+        )
+
+        assert response.status_code == 200
+        profile = response.json()["profile"]
+        assert profile["created_at"].endswith("Z")
+        assert profile["updated_at"].endswith("Z")
+
+        [platform] = profile["platforms"]
+        assert set(platform) == {
+            "id", "name", "handle", "followers", "engagement_rate",
+            "top_countries", "top_age_groups", "gender_split",
+        }
+        assert platform["id"] == str(test_creator_verified["platform"]["id"])
+        assert platform["followers"] == 100000
+        assert platform["engagement_rate"] == 4.5
+
+    async def test_get_hotel_details_listing_shape(
+        self, client: AsyncClient, test_admin, test_hotel_verified
+    ):
+        """Test the nested listing tree keeps its keys and UTC "Z" timestamps."""
+        user_id = str(test_hotel_verified["user"]["id"])
+        listing_id = test_hotel_verified["listing"]["listing"]["id"]
+
+        response = await client.get(
+            f"/admin/users/{user_id}",
+            headers=get_auth_headers(test_admin["token"])
+        )
+
+        assert response.status_code == 200
+        profile = response.json()["profile"]
+        assert profile["created_at"].endswith("Z")
+
+        [listing] = profile["listings"]
+        assert set(listing) == {
+            "id", "hotel_profile_id", "name", "location", "description", "accommodation_type",
+            "images", "status", "created_at", "updated_at", "collaboration_offerings",
+            "creator_requirements",
+        }
+        [offering] = listing["collaboration_offerings"]
+        assert set(offering) == {
+            "id", "listing_id", "collaboration_type", "availability_months", "platforms",
+            "free_stay_min_nights", "free_stay_max_nights", "paid_max_amount",
+            "discount_percentage", "created_at", "updated_at",
+        }
+        requirements = listing["creator_requirements"]
+        assert set(requirements) == {
+            "id", "listing_id", "platforms", "min_followers", "target_countries",
+            "target_age_min", "target_age_max", "target_age_groups", "creator_types",
+            "created_at", "updated_at",
+        }
+        assert listing["id"] == str(listing_id)
+        assert offering["collaboration_type"] == "Free Stay"
+        assert requirements["min_followers"] == 10000
+
+        stored = await Database.fetchrow(
+            """
+            SELECT l.created_at AS listing_created_at, o.created_at AS offering_created_at,
+                   r.created_at AS requirements_created_at
+            FROM hotel_listings l
+            JOIN listing_collaboration_offerings o ON o.listing_id = l.id
+            JOIN listing_creator_requirements r ON r.listing_id = l.id
+            WHERE l.id = $1
+            """,
+            listing_id
+        )
+        for node, key in (
+            (listing, "listing_created_at"),
+            (offering, "offering_created_at"),
+            (requirements, "requirements_created_at"),
+        ):
+            assert node["created_at"].endswith("Z")
+            assert node["updated_at"].endswith("Z")
+            assert datetime.fromisoformat(node["created_at"].replace("Z", "+00:00")) == stored[key]
+
     async def test_get_user_not_found(
         self, client: AsyncClient, test_admin
     ):
@@ -298,6 +654,42 @@ class TestCreateUser:
 
         assert response.status_code == 201
 
+    async def test_create_user_platform_engagement_rate_rounding(
+        self, client: AsyncClient, test_admin
+    ):
+        """Test engagement rates are stored rounded from their decimal form, not their float expansion."""
+        response = await client.post(
+            "/admin/users",
+            json={
+                "email": generate_test_email("engagement"),
+                "password": "SecurePassword123!",
+                "name": "Creator Engagement Rounding",
+                "type": "creator",
+                "creatorProfile": {
+                    "location": "London",
+                    "platforms": [
+                        {"name": "Instagram", "handle": "@a", "followers": 1000, "engagementRate": 1.005},
+                        {"name": "TikTok", "handle": "@b", "followers": 1000, "engagementRate": 2.675},
+                        {"name": "YouTube", "handle": "@c", "followers": 1000, "engagementRate": 4.345}
+                    ]
+                }
+            },
+            headers=get_auth_headers(test_admin["token"])
+        )
+
+        assert response.status_code == 201
+        rows = await Database.fetch(
+            """
+            SELECT p.name, p.engagement_rate::text AS engagement_rate
+            FROM creator_platforms p JOIN creators c ON c.id = p.creator_id
+            WHERE c.user_id = $1
+            """,
+            response.json()["id"]
+        )
+        assert {row["name"]: row["engagement_rate"] for row in rows} == {
+            "Instagram": "1.01", "TikTok": "2.68", "YouTube": "4.35",
+        }
+
 
 class TestUpdateUser:
     """Tests for PUT /admin/users/{user_id}"""
@@ -484,6 +876,7 @@ class TestUpdateCreatorProfile:
         data = response.json()
         assert len(data["platforms"]) == 1
         assert data["platforms"][0]["name"] == "TikTok"
+        assert data["audience_size"] == 200000
 
     async def test_update_creator_wrong_type(
         self, client: AsyncClient, test_admin, test_hotel
@@ -576,6 +969,42 @@ class TestAdminCreateListing:
         data = response.json()
         assert data["name"] == "Admin Created Listing"
 
+    @pytest.mark.filterwarnings("error::UserWarning")
+    async def test_create_listing_timestamps(
+        self, client: AsyncClient, test_admin, test_hotel
+    ):
+        """Test the listing and its nested rows all serialize timestamps as UTC "Z"."""
+        user_id = str(test_hotel["user"]["id"])
+
+        response = await client.post(
+            f"/admin/users/{user_id}/listings",
+            json={
+                "name": "Timestamp Listing",
+                "location": "Lisbon",
+                "description": "Listing used to check response timestamps",
+                "collaborationOfferings": [
+                    {
+                        "collaborationType": "Paid",
+                        "availabilityMonths": ["May"],
+                        "platforms": ["YouTube"],
+                        "paidMaxAmount": 250
+                    }
+                ],
+                "creatorRequirements": {"platforms": ["YouTube"]}
+            },
+            headers=get_auth_headers(test_admin["token"])
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        stored = await Database.fetchrow(
+            "SELECT created_at FROM hotel_listings WHERE id = $1", data["id"]
+        )
+        assert datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")) == stored["created_at"]
+        for node in (data, data["collaboration_offerings"][0], data["creator_requirements"]):
+            assert node["created_at"].endswith("Z")
+            assert node["updated_at"].endswith("Z")
+
     async def test_create_listing_wrong_type(
         self, client: AsyncClient, test_admin, test_creator
     ):
@@ -644,6 +1073,117 @@ class TestAdminUpdateListing:
         assert response.status_code == 404
 
 
+class TestAdminUpdateListingOfferings:
+    """Tests for collaboration offering replacement via PUT /admin/users/{user_id}/listings/{listing_id}"""
+
+    FREE_STAY = {
+        "collaborationType": "Free Stay",
+        "availabilityMonths": ["June"],
+        "platforms": ["Instagram", "TikTok"],
+        "freeStayMinNights": 3,
+        "freeStayMaxNights": 7
+    }
+    PAID = {
+        "collaborationType": "Paid",
+        "availabilityMonths": ["July"],
+        "platforms": ["YouTube"],
+        "paidMaxAmount": 500
+    }
+    DISCOUNT = {
+        "collaborationType": "Discount",
+        "availabilityMonths": ["August"],
+        "platforms": ["Instagram"],
+        "discountPercentage": 20
+    }
+
+    async def _put_offerings(self, client: AsyncClient, admin_token: str, hotel_data, offerings):
+        user_id = str(hotel_data["user"]["id"])
+        listing_id = str(hotel_data["listing"]["listing"]["id"])
+        return await client.put(
+            f"/admin/users/{user_id}/listings/{listing_id}",
+            json={"collaborationOfferings": offerings},
+            headers=get_auth_headers(admin_token)
+        )
+
+    async def _stored_offerings(self, hotel_data) -> dict:
+        rows = await Database.fetch(
+            "SELECT id, collaboration_type FROM listing_collaboration_offerings WHERE listing_id = $1",
+            hotel_data["listing"]["listing"]["id"]
+        )
+        return {row["collaboration_type"]: str(row["id"]) for row in rows}
+
+    async def test_add_offering(
+        self, client: AsyncClient, test_admin, test_hotel_verified
+    ):
+        """Test adding an offering keeps the existing one in place."""
+        existing_id = str(test_hotel_verified["listing"]["offering"]["id"])
+
+        response = await self._put_offerings(
+            client, test_admin["token"], test_hotel_verified, [self.FREE_STAY, self.PAID]
+        )
+
+        assert response.status_code == 200
+        offerings = {o["collaboration_type"]: o for o in response.json()["collaboration_offerings"]}
+        assert set(offerings) == {"Free Stay", "Paid"}
+        assert offerings["Free Stay"]["id"] == existing_id
+        assert offerings["Free Stay"]["availability_months"] == ["June"]
+        assert await self._stored_offerings(test_hotel_verified) == {
+            "Free Stay": existing_id,
+            "Paid": offerings["Paid"]["id"],
+        }
+
+    async def test_remove_offering(
+        self, client: AsyncClient, test_admin, test_hotel_verified
+    ):
+        """Test offerings left out of the request are deleted."""
+        response = await self._put_offerings(
+            client, test_admin["token"], test_hotel_verified, [self.PAID]
+        )
+
+        assert response.status_code == 200
+        offerings = response.json()["collaboration_offerings"]
+        assert [o["collaboration_type"] for o in offerings] == ["Paid"]
+        assert set(await self._stored_offerings(test_hotel_verified)) == {"Paid"}
+
+    async def test_change_one_offering_type(
+        self, client: AsyncClient, test_admin, test_hotel_verified
+    ):
+        """Test swapping one type replaces only that offering."""
+        first = await self._put_offerings(
+            client, test_admin["token"], test_hotel_verified, [self.FREE_STAY, self.PAID]
+        )
+        assert first.status_code == 200
+        paid_id = (await self._stored_offerings(test_hotel_verified))["Paid"]
+
+        response = await self._put_offerings(
+            client, test_admin["token"], test_hotel_verified, [self.PAID, self.DISCOUNT]
+        )
+
+        assert response.status_code == 200
+        offerings = {o["collaboration_type"]: o for o in response.json()["collaboration_offerings"]}
+        assert set(offerings) == {"Paid", "Discount"}
+        assert offerings["Paid"]["id"] == paid_id
+        assert offerings["Discount"]["discount_percentage"] == 20
+        stored = await self._stored_offerings(test_hotel_verified)
+        assert set(stored) == {"Paid", "Discount"}
+        assert stored["Paid"] == paid_id
+
+    async def test_repeated_collaboration_type_saved_unchanged(
+        self, client: AsyncClient, test_admin, test_hotel_verified
+    ):
+        """Test a listing with two offerings of one type can be saved as-is."""
+        offerings = [self.PAID, {**self.PAID, "paidMaxAmount": 900}]
+        first = await self._put_offerings(client, test_admin["token"], test_hotel_verified, offerings)
+        assert first.status_code == 200
+        ids = sorted(o["id"] for o in first.json()["collaboration_offerings"])
+        assert len(ids) == 2
+
+        response = await self._put_offerings(client, test_admin["token"], test_hotel_verified, offerings)
+
+        assert response.status_code == 200
+        assert sorted(o["id"] for o in response.json()["collaboration_offerings"]) == ids
+
+
 class TestAdminDeleteListing:
     """Tests for DELETE /admin/users/{user_id}/listings/{listing_id}"""
 
@@ -785,3 +1325,20 @@ class TestAdminAuthorization:
         )
 
         assert response.status_code == 403
+
+    async def test_demoted_admin_loses_access_immediately(
+        self, client: AsyncClient, test_admin
+    ):
+        """Test that admin rights are re-checked on every request."""
+        headers = get_auth_headers(test_admin["token"])
+
+        response = await client.get("/admin/users", headers=headers)
+        assert response.status_code == 200
+
+        await AuthDatabase.execute(
+            "UPDATE users SET type = 'creator' WHERE id = $1",
+            test_admin["user"]["id"]
+        )
+
+        response = await client.get("/admin/users", headers=headers)
+        assert response.status_code == 403
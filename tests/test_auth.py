@@ -1,11 +1,15 @@
 """
 Tests for authentication endpoints.
 """
+import asyncio
 import pytest
+from datetime import timedelta
 from httpx import AsyncClient
 from unittest.mock import patch, AsyncMock
 
 from app.database import Database, AuthDatabase
+from app.dependencies import _token_payload_cache
+from app.jwt_utils import create_access_token
 from tests.conftest import (
     get_auth_headers,
     create_test_user,
@@ -419,6 +423,55 @@ class TestValidateToken:
         assert data["valid"] is False
 
 
+class TestTokenPayloadCache:
+    """Tests for the cached bearer token verification in app.dependencies"""
+
+    async def test_cached_token_rejected_after_expiry(
+        self, client: AsyncClient, cleanup_database
+    ):
+        """Test a cached token stops authenticating once its exp has passed."""
+        user = await create_test_user()
+        token = create_access_token(
+            {"sub": str(user["id"]), "email": user["email"], "type": "creator"},
+            expires_delta=timedelta(seconds=2)
+        )
+
+        response = await client.get(
+            "/collaborations/conversations",
+            headers=get_auth_headers(token)
+        )
+        assert response.status_code == 200
+        assert _token_payload_cache.get(token) is not None
+
+        await asyncio.sleep(2.5)
+
+        response = await client.get(
+            "/collaborations/conversations",
+            headers=get_auth_headers(token)
+        )
+        assert response.status_code == 401
+        assert "expired" in response.json()["detail"].lower()
+
+    async def test_cached_token_rejected_after_suspension(
+        self, client: AsyncClient, test_creator
+    ):
+        """Test suspending a user takes effect even while their token is cached."""
+        headers = get_auth_headers(test_creator["token"])
+
+        response = await client.get("/collaborations/conversations", headers=headers)
+        assert response.status_code == 200
+        assert _token_payload_cache.get(test_creator["token"]) is not None
+
+        await AuthDatabase.execute(
+            "UPDATE users SET status = 'suspended' WHERE id = $1",
+            test_creator["user"]["id"]
+        )
+
+        response = await client.get("/collaborations/conversations", headers=headers)
+        assert response.status_code == 403
+        assert "suspended" in response.json()["detail"].lower()
+
+
 class TestForgotPassword:
     """Tests for POST /auth/forgot-password"""
 